@@ -35,19 +35,352 @@ AI 교육 전문가 팀 - Streamlit 웹 애플리케이션
 """
 
 # 필요한 라이브러리 임포트
+# google.generativeai는 불러오는 데 시간이 걸리므로 모델을 처음 만들 때 가져옴 (API 키 입력 전 화면을 빠르게 표시)
 import streamlit as st
-from google.generativeai import GenerativeModel
-import google.generativeai as genai
 import os
-from datetime import datetime
 import time
+from datetime import datetime
+from functools import cached_property
 import json
+import asyncio
+import threading
+import queue
+import hashlib
+from collections import deque
+
+# ============================================================================
+# 비동기 실행 도우미
+# Gemini 비동기 호출을 하나의 백그라운드 이벤트 루프에서 처리
+# ============================================================================
+
+@st.cache_resource(show_spinner=False)
+def _get_event_loop():
+    """
+    프로세스 전체에서 공유하는 백그라운드 이벤트 루프 생성
+    SDK의 비동기 클라이언트가 항상 같은 루프에 묶이도록 매번 asyncio.run을 호출하지 않음
+    Returns:
+        asyncio.AbstractEventLoop: 별도 스레드에서 실행 중인 이벤트 루프
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def _run_async(coro):
+    """
+    코루틴을 백그라운드 이벤트 루프에서 실행하고 결과를 기다림
+    Args:
+        coro: 실행할 코루틴
+    Returns:
+        코루틴의 반환값
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+# 동시에 진행할 Gemini 호출 수 상한 (모든 세션이 같은 이벤트 루프를 공유하므로 프로세스 전체에 적용)
+_MAX_CONCURRENT_REQUESTS = 8
+
+
+@st.cache_resource(show_spinner=False)
+def _get_request_semaphore():
+    """
+    Gemini 호출의 동시 실행 수를 제한하는 세마포어 생성 (프로세스당 1개)
+    스크립트가 다시 실행되어도 같은 객체를 공유하도록 캐시하고, 백그라운드 이벤트 루프 안에서 생성
+    Returns:
+        asyncio.Semaphore: 호출 제한용 세마포어
+    """
+    async def create():
+        return asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return _run_async(create())
+
+
+_REQUEST_SEMAPHORE = _get_request_semaphore()
+
+
+def _iter_events(make_coro):
+    """
+    코루틴을 백그라운드 이벤트 루프에서 실행하면서, 코루틴이 보내는 이벤트를 스크립트 스레드로 하나씩 전달
+    Streamlit 요소는 스크립트 스레드에서만 갱신할 수 있으므로 이벤트를 큐로 전달받아 순서대로 yield
+    스크립트가 중단되어 제너레이터가 닫히면 실행 중인 코루틴도 취소 (남은 호출의 토큰 과금과 세마포어 점유 방지)
+    Args:
+        make_coro (callable): emit(kind, payload) 콜백을 받아 코루틴을 만드는 함수
+    Yields:
+        tuple: (kind, payload) 이벤트
+    Returns:
+        코루틴의 반환값 (yield from 또는 StopIteration.value로 전달)
+    """
+    events = queue.Queue()
+    future = asyncio.run_coroutine_threadsafe(
+        make_coro(lambda kind, payload: events.put((kind, payload))), _get_event_loop()
+    )
+    try:
+        while not future.done() or not events.empty():
+            try:
+                yield events.get(timeout=0.1)
+            except queue.Empty:
+                continue
+    finally:
+        if not future.done():
+            future.cancel()
+    return future.result()
+
+
+async def _generate_streaming(model, prompt, on_chunk=None):
+    """
+    Gemini 응답을 스트리밍으로 받아 조각마다 on_chunk 콜백을 호출
+    Args:
+        model (GenerativeModel): 호출할 모델
+        prompt (str): 프롬프트
+        on_chunk (callable, optional): 응답 조각(str)을 받을 콜백
+    Returns:
+        str: 전체 응답 텍스트
+    """
+    parts = []
+    async with _REQUEST_SEMAPHORE:
+        response = await model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            parts.append(chunk.text)
+            if on_chunk:
+                on_chunk(chunk.text)
+    return "".join(parts)
+
+
+async def _generate(model, prompt, **kwargs):
+    """
+    동시 실행 수 제한 안에서 Gemini 응답을 한 번에 받음
+    Args:
+        model (GenerativeModel): 호출할 모델
+        prompt (str): 프롬프트
+        **kwargs: generate_content_async에 전달할 추가 인자
+    Returns:
+        GenerateContentResponse: 모델 응답
+    """
+    async with _REQUEST_SEMAPHORE:
+        return await model.generate_content_async(prompt, **kwargs)
+
+
+# ============================================================================
+# 캐시 도우미
+# Streamlit은 위젯 조작마다 스크립트를 다시 실행하므로 무거운 객체와 결과를 재사용
+# ============================================================================
+
+# 기본 모델 (빠른 모드의 단일 요청에 사용)
+_BASE_MODEL_NAME = 'gemini-1.5-flash-8b'
+
+# 단계별 모델 구성: 중간 결과인 1·2단계는 작은 모델과 짧은 출력 한도로, 사용자에게 보이는 3단계는 상위 모델로 생성
+# False로 바꾸면 모든 전문가가 기본 모델을 사용
+_USE_TIERED_MODELS = True
+_DRAFT_MODEL_NAME = 'gemini-1.5-flash-8b'
+_DRAFT_GENERATION_CONFIG = {"max_output_tokens": 1024, "temperature": 0.3}
+_FINAL_MODEL_NAME = 'gemini-1.5-flash'
+_FINAL_GENERATION_CONFIG = {"max_output_tokens": 2048}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_clients(api_key):
+    """
+    API 키 전용 Gemini 클라이언트를 키별로 한 번만 생성
+    genai.configure는 프로세스 전역 설정이라 여러 세션의 키가 섞이므로 사용하지 않음
+    비동기 클라이언트는 gRPC 채널이 백그라운드 이벤트 루프에 묶이도록 루프 안에서 생성
+    Args:
+        api_key (str): Google AI API 키
+    Returns:
+        tuple: (동기 클라이언트, 비동기 클라이언트)
+    """
+    from google.ai import generativelanguage as glm
+    
+    options = {"api_key": api_key}
+    
+    async def create_async_client():
+        return glm.GenerativeServiceAsyncClient(client_options=options)
+    
+    return glm.GenerativeServiceClient(client_options=options), _run_async(create_async_client())
+
+
+def _bind_clients(model, api_key):
+    """
+    모델 핸들이 전역 설정 대신 해당 API 키의 클라이언트로 호출하도록 지정
+    Args:
+        model (GenerativeModel): 모델 핸들
+        api_key (str): Google AI API 키
+    Returns:
+        GenerativeModel: 같은 모델 핸들
+    """
+    model._client, model._async_client = _get_clients(api_key)
+    return model
+
+
+@st.cache_resource(show_spinner=False)
+def _get_model(api_key, model_name=_BASE_MODEL_NAME):
+    """
+    API 키와 모델별로 해당 키에 묶인 Gemini 모델 핸들을 한 번만 생성
+    Args:
+        api_key (str): Google AI API 키
+        model_name (str): Gemini 모델 이름
+    Returns:
+        GenerativeModel: 공유 모델 핸들
+    """
+    from google.generativeai import GenerativeModel
+    
+    return _bind_clients(GenerativeModel(model_name), api_key)
+
+
+def _derive_model(api_key, model, system_instruction, generation_config=None):
+    """
+    기존 모델 핸들과 같은 모델에 시스템 지시와 생성 설정을 적용하고 API 키에 묶은 전문가용 핸들 생성
+    Args:
+        api_key (str): Google AI API 키
+        model (GenerativeModel): 기준 모델 핸들
+        system_instruction (str): 시스템 지시
+        generation_config (dict): 생성 설정 (없으면 기본값)
+    Returns:
+        GenerativeModel: 전문가용 모델 핸들
+    """
+    from google.generativeai import GenerativeModel
+    
+    return _bind_clients(
+        GenerativeModel(
+            model.model_name,
+            generation_config=generation_config,
+            system_instruction=system_instruction,
+        ),
+        api_key,
+    )
+
+
+def _is_invalid_api_key_error(error):
+    """
+    API 호출 오류가 API 키 인증 실패인지 확인 (네트워크·할당량·서버 오류와 구분)
+    Args:
+        error (Exception): API 호출 중 발생한 예외
+    Returns:
+        bool: 키가 유효하지 않거나 권한이 없는 경우 True
+    """
+    # google-generativeai를 불러올 때 함께 설치되는 모듈이므로 모델 생성 이후에만 사용
+    from google.api_core import exceptions
+    
+    if isinstance(error, (exceptions.PermissionDenied, exceptions.Unauthenticated)):
+        return True
+    return isinstance(error, exceptions.InvalidArgument) and "API_KEY_INVALID" in str(error)
+
+
+def _guide_cache_key(service_type, input_data, parallel=True):
+    """
+    서비스 유형과 입력 데이터로 결정적인 캐시 키 생성
+    Args:
+        service_type (str): 요청 서비스 유형
+        input_data (dict): 사용자 입력 데이터
+        parallel (bool): 기초·실무 분석을 동시에 실행했는지 여부 (순차 검토 결과는 따로 저장)
+    Returns:
+        str: SHA-1 해시 문자열
+    """
+    key = {"s": service_type, "i": input_data}
+    if not parallel:
+        key["seq"] = True
+    payload = json.dumps(key, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
 
 # ============================================================================
 # 에이전틱 워크플로우 기반 AI 교육 팀 시스템
 # 3명의 특화된 교육 전문가가 팀을 이루어 사용자를 지원
 # ============================================================================
 
+# 단일 요청(빠른 모드) 응답 형식: 세 전문가의 결과를 하나의 JSON 객체로 반환
+_BATCHED_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "foundations": {"type": "STRING"},
+        "practical": {"type": "STRING"},
+        "learning": {"type": "STRING"},
+    },
+    "required": ["foundations", "practical", "learning"],
+}
+
+def _fmt(data):
+    """
+    사용자 입력을 프롬프트에 넣기 위한 JSON 문자열로 변환
+    한글을 \\uXXXX로 이스케이프하지 않아 입력 토큰을 줄이고, 키 순서를 고정해 같은 입력이 같은 프롬프트가 되도록 함
+    Args:
+        data (dict): 사용자 입력 데이터
+    Returns:
+        str: 들여쓰기된 JSON 문자열
+    """
+    return json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+# 1·2단계 전문가가 응답 맨 앞에 작성하는 핵심 요약 (다음 단계에는 원문 대신 요약만 전달)
+_SUMMARY_HEADING = "### 핵심 요약"
+_SUMMARY_END = "---"
+
+_SUMMARY_INSTRUCTION = f"""
+응답은 반드시 '{_SUMMARY_HEADING}' 제목으로 시작하고, 그 아래에 다른 전문가가 참고할 핵심 내용을
+3~5개의 글머리표로 200토큰(한글 약 300자) 이내로 정리해 주세요. 요약이 끝나면 '{_SUMMARY_END}' 구분선을 넣고 본문을 이어서 작성해 주세요.
+"""
+
+
+def _extract_summary(text):
+    """
+    전문가 응답에서 핵심 요약 부분만 추출
+    요약 형식을 지키지 않은 응답은 내용이 누락되지 않도록 원문을 그대로 반환
+    Args:
+        text (str): 전문가 응답
+    Returns:
+        str: 핵심 요약 또는 원문
+    """
+    start = text.find(_SUMMARY_HEADING)
+    if start == -1:
+        return text
+    summary = text[start + len(_SUMMARY_HEADING):]
+    end = summary.find("\n" + _SUMMARY_END)
+    if end == -1:
+        return text
+    return summary[:end].strip() or text
+
+
+# 동시에 실행된 두 전문가의 결과를 학습 경로 전문가에게 전달하는 형식
+_COMBINED_EXPLANATION_TMPL = """
+[기초 개념 전문가]
+{foundations}
+
+[실무 응용 전문가]
+{practical}
+"""
+
+_BATCHED_PROMPT_TMPL = """
+당신은 다음 세 명의 전문가로 구성된 AI 교육 팀입니다.
+
+1. '{foundations_name}'
+{foundations_intro}
+2. '{practical_name}'
+{practical_intro}
+3. '{learning_name}'
+{learning_intro}
+
+각 전문가의 지시를 수행하고 결과를 JSON 객체로 반환해주세요:
+- foundations: 기초 개념 전문가의 설명 (핵심 개념과 이론적 배경)
+- practical: 실무 응용 전문가의 설명 (실제 적용 사례와 업계 통찰력)
+- learning: 학습 경로 전문가가 앞의 두 설명을 균형있게 통합하여 작성한 최종 학습 가이드
+
+=== 기초 개념 전문가 지시 ===
+{foundations_body}
+
+=== 실무 응용 전문가 지시 ===
+{practical_body}
+
+=== 학습 경로 전문가 지시 ===
+{learning_body}
+
+learning 항목은 명확하고 실행 가능한 단계별 학습 가이드로 작성해주세요.
+"""
+
+# 최종 학습 가이드 제목
+_RESULT_HEADER = "### 📊 전문가 팀 학습 가이드"
+
+# 세션에 보관할 워크플로우 로그 수 상한 (통계는 별도 카운터로 누적)
+_MAX_WORKFLOW_LOGS = 32
+
+
 class AIEducationTeam:
     """
     AI 기반 교육 팀을 관리하는 클래스
@@ -59,33 +392,136 @@ class AIEducationTeam:
         AI 교육 팀 초기화
         Args:
             api_key (str): Google AI API 키
+        Raises:
+            ValueError: API 키가 유효하지 않은 경우
+            ConnectionError: 네트워크·할당량·서버 오류로 키를 확인하지 못한 경우
         """
         self.api_key = api_key
-        genai.configure(api_key=api_key)
-        self.model = GenerativeModel('gemini-1.5-flash-8b')
+        self.model = _get_model(api_key)
         
-        # 3명의 특화된 교육 전문가 초기화
-        self.foundations_expert = AIFoundationsExpert(self.model)  # AI 기초 개념 전문가
-        self.practical_expert = PracticalAIExpert(self.model)      # 실무 응용 전문가
-        self.learning_expert = LearningPathExpert(self.model)      # 학습 경로 및 성장 전문가
+        # API 키를 가벼운 토큰 계산 요청으로 검증 (팀은 _get_team에서 키마다 한 번만 생성되므로 검증도 한 번)
+        try:
+            self.model.count_tokens("ping")
+        except Exception as e:
+            if _is_invalid_api_key_error(e):
+                raise ValueError(f"유효하지 않은 API 키입니다: {str(e)}") from e
+            raise ConnectionError(f"Google AI 서버에 연결하지 못했습니다: {str(e)}") from e
+        
+        # 1·2단계(초안)와 3단계(최종)에 사용할 모델
+        if _USE_TIERED_MODELS:
+            self.draft_model = _get_model(api_key, _DRAFT_MODEL_NAME)
+            self.final_model = _get_model(api_key, _FINAL_MODEL_NAME)
+            self.draft_config = _DRAFT_GENERATION_CONFIG
+            self.final_config = _FINAL_GENERATION_CONFIG
+        else:
+            self.draft_model = self.final_model = self.model
+            self.draft_config = self.final_config = None
+    
+    @property
+    def workflow_logs(self):
+        """
+        세션에 저장된 최근 워크플로우 로그 (재실행 사이에도 유지)
+        """
+        return st.session_state.setdefault("workflow_logs", deque(maxlen=_MAX_WORKFLOW_LOGS))
+    
+    def _record_log(self, workflow_log):
+        """
+        워크플로우 로그를 세션에 추가하고 요청 통계를 갱신 (오래된 로그는 자동으로 제거)
+        Args:
+            workflow_log (dict): 완료 또는 오류 상태의 워크플로우 로그
+        """
+        self.workflow_logs.append(workflow_log)
+        st.session_state.total_requests = st.session_state.get("total_requests", 0) + 1
+        if workflow_log["status"] == "completed":
+            st.session_state.successful_requests = st.session_state.get("successful_requests", 0) + 1
+    
+    def warm_up(self):
+        """
+        사용자가 첫 요청을 보내기 전에 백그라운드 이벤트 루프의 비동기 연결을 미리 준비 (결과를 기다리지 않음)
+        같은 API 키의 모든 모델 핸들은 클라이언트를 공유하므로 기준 모델의 토큰 계산 요청(과금 없음)만으로
+        연결과 인증이 수립되며, 전문가는 처음 사용할 때까지 생성하지 않음
+        """
+        async def ping():
+            try:
+                await self.model.count_tokens_async("ping")
+            except Exception:
+                pass
         
-        # 워크플로우 로그 초기화
-        self.workflow_logs = []
+        asyncio.run_coroutine_threadsafe(ping(), _get_event_loop())
     
-    def get_ai_education(self, service_type, input_data):
+    # 3명의 특화된 교육 전문가는 캐시된 결과로 응답하는 요청에서는 필요 없으므로 처음 사용할 때 생성
+    @cached_property
+    def foundations_expert(self):
+        """AI 기초 개념 전문가"""
+        return AIFoundationsExpert(self.api_key, self.draft_model, self.draft_config)
+    
+    @cached_property
+    def practical_expert(self):
+        """실무 응용 전문가"""
+        return PracticalAIExpert(self.api_key, self.draft_model, self.draft_config)
+    
+    @cached_property
+    def learning_expert(self):
+        """학습 경로 및 성장 전문가"""
+        return LearningPathExpert(self.api_key, self.final_model, self.final_config)
+    
+    def get_ai_education(self, service_type, input_data, parallel=True):
         """
-        사용자 요청에 따라 3명의 전문가가 순차적으로 협업하여 교육 지원 제공
+        사용자 요청에 따라 3명의 전문가가 협업하여 교육 지원 제공
+        기초 개념 분석과 실무 응용 분석은 서로 의존하지 않으므로 기본적으로 동시에 실행하고,
+        학습 경로 전문가가 두 결과를 통합하여 최종 가이드를 작성
         Args:
             service_type (str): 요청 서비스 유형
             input_data (dict): 사용자 입력 데이터
+            parallel (bool): False이면 실무 전문가가 기초 전문가의 설명을 검토하는 순차 방식으로 실행
         Returns:
             str: 최종 교육 지원 결과
         """
+        return "".join(self._iter_education(service_type, input_data, parallel))
+    
+    def get_ai_education_stream(self, service_type, input_data, header=_RESULT_HEADER, parallel=True):
+        """
+        get_ai_education과 같은 워크플로우를 실행하면서 최종 가이드를 생성되는 대로 전달 (st.write_stream용)
+        결과 제목은 첫 조각 직전에 표시하여 진행 상황 아래에 위치하도록 함
+        Args:
+            service_type (str): 요청 서비스 유형
+            input_data (dict): 사용자 입력 데이터
+            header (str): 결과 제목 (마크다운)
+            parallel (bool): 기초·실무 분석을 동시에 실행할지 여부
+        Yields:
+            str: 최종 교육 지원 결과의 조각
+        """
+        header_shown = False
+        for text in self._iter_education(service_type, input_data, parallel):
+            if not header_shown:
+                st.markdown(header)
+                header_shown = True
+            yield text
+    
+    def _iter_education(self, service_type, input_data, parallel=True):
+        """
+        3명의 전문가 워크플로우를 실행하고 최종 가이드를 조각 단위로 전달
+        1·2단계 응답은 진행 상황 영역에 실시간으로 표시
+        Args:
+            service_type (str): 요청 서비스 유형
+            input_data (dict): 사용자 입력 데이터
+            parallel (bool): 기초·실무 분석을 동시에 실행할지 여부
+        Yields:
+            str: 최종 교육 지원 결과의 조각 (캐시된 결과와 오류 안내는 한 번에 전달)
+        """
+        # 동일한 요청은 세션에 저장된 결과를 즉시 반환
+        cache_key = _guide_cache_key(service_type, input_data, parallel)
+        guides = st.session_state.setdefault("guides", {})
+        if cache_key in guides:
+            yield guides[cache_key]
+            return
+        
         try:
-            # 워크플로우 기록 시작
+            # 워크플로우 기록 시작 (단계별 기록은 요청 시작 후 경과 시간으로 저장)
+            started = time.monotonic()
             workflow_log = {
                 "service_type": service_type,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
                 "experts_involved": ["AIFoundationsExpert", "PracticalAIExpert", "LearningPathExpert"],
                 "steps": [],
                 "status": "in_progress"
@@ -95,54 +531,387 @@ class AIEducationTeam:
             progress_container = st.container()
             
             with progress_container:
-                # 1단계: AI 기초 전문가의 초기 분석 및 개념 설명
-                st.markdown("### 🧠 1단계: AI 기초 개념 분석")
-                with st.spinner("김민준 기초 전문가가 핵심 개념을 분석 중입니다..."):
-                    initial_explanation = self.foundations_expert.explain(service_type, input_data)
-                    workflow_log["steps"].append({
-                        "expert": "AIFoundationsExpert",
-                        "action": "initial_explanation",
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
-                    st.success("✅ 기초 개념 분석 완료!")
-                    time.sleep(1)  # 사용자 경험을 위한 짧은 대기
-                
-                # 2단계: 실무 응용 전문가의 실전 활용법 및 사례 추가
-                st.markdown("### 💼 2단계: 실무 응용 분석")
-                with st.spinner("박서연 실무 전문가가 실제 사례를 분석 중입니다..."):
-                    practical_enhanced_explanation = self.practical_expert.enhance(initial_explanation, service_type, input_data)
-                    workflow_log["steps"].append({
-                        "expert": "PracticalAIExpert",
-                        "action": "practical_enhancement",
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
-                    st.success("✅ 실무 사례 분석 완료!")
-                    time.sleep(1)
+                # 1·2단계: AI 기초 전문가의 개념 설명과 실무 응용 전문가의 실전 활용법을 동시에 분석
+                st.markdown("### 🧠 1단계: AI 기초 개념 분석 · 💼 2단계: 실무 응용 분석")
+                drafts_status = st.empty()
+                foundations_col, practical_col = st.columns(2)
+                foundations_col.caption("김민준 기초 전문가")
+                practical_col.caption("박서연 실무 전문가")
+                previews = {"foundations": foundations_col.empty(), "practical": practical_col.empty()}
                 
-                # 3단계: 학습 경로 전문가의 맞춤형 학습 계획 및 자원 최적화
+                # 3단계: 학습 경로 전문가의 맞춤형 학습 계획 및 자원 최적화 (최종 가이드는 결과 영역에 표시)
                 st.markdown("### 📚 3단계: 맞춤형 학습 경로 설계")
-                with st.spinner("이준호 학습 경로 전문가가 최종 학습 계획을 준비 중입니다..."):
-                    final_guidance = self.learning_expert.finalize(practical_enhanced_explanation, service_type, input_data)
-                    workflow_log["steps"].append({
-                        "expert": "LearningPathExpert",
-                        "action": "finalization",
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
-                    st.success("✅ 학습 경로 설계 완료!")
+                learning_status = st.empty()
+            
+            if parallel:
+                drafts_status.info("김민준 기초 전문가와 박서연 실무 전문가가 동시에 분석 중입니다...")
+            else:
+                drafts_status.info("김민준 기초 전문가의 분석을 박서연 실무 전문가가 이어서 보완합니다...")
+            texts = dict.fromkeys(previews, "")
+            draft_steps = {
+                "foundations": ("AIFoundationsExpert", "initial_explanation"),
+                "practical": ("PracticalAIExpert", "practical_enhancement"),
+            }
+            
+            # 이벤트는 스크립트 스레드에서 처리 (화면 갱신은 미리 만든 요소에만 수행)
+            # 스크립트가 중단되면 이벤트 제너레이터를 바로 닫아 백그라운드 코루틴을 취소
+            events = _iter_events(lambda emit: self._pipeline(service_type, input_data, emit, parallel))
+            try:
+                while True:
+                    try:
+                        kind, payload = next(events)
+                    except StopIteration as stop:
+                        final_guidance = stop.value
+                        break
+                    
+                    if kind == "chunk":
+                        key, text = payload
+                        if key == "learning":
+                            yield text
+                            continue
+                        texts[key] += text
+                        previews[key].markdown(texts[key])
+                    elif kind == "draft_done":
+                        # 전문가마다 응답이 끝난 시점을 따로 기록
+                        expert, action = draft_steps[payload]
+                        workflow_log["steps"].append({
+                            "expert": expert,
+                            "action": action,
+                            "elapsed_ms": int((time.monotonic() - started) * 1000)
+                        })
+                    elif kind == "drafts_done":
+                        drafts_status.success("✅ 기초 개념 분석 및 실무 사례 분석 완료!")
+                        learning_status.info("이준호 학습 경로 전문가가 최종 학습 계획을 작성 중입니다...")
+            finally:
+                events.close()
+            
+            workflow_log["steps"].append({
+                "expert": "LearningPathExpert",
+                "action": "finalization",
+                "elapsed_ms": int((time.monotonic() - started) * 1000)
+            })
+            learning_status.success("✅ 학습 경로 설계 완료!")
             
             # 워크플로우 로그 저장
             workflow_log["status"] = "completed"
-            self.workflow_logs.append(workflow_log)
+            self._record_log(workflow_log)
+            
+            # 완료된 결과만 캐시에 저장 (1·2단계 분석 원문은 get_draft_explanations로 조회)
+            guides[cache_key] = final_guidance
+            st.session_state.setdefault("guide_drafts", {})[cache_key] = texts
+            
+        except Exception as e:
+            st.error(f"❌ 오류가 발생했습니다: {str(e)}")
+            workflow_log["status"] = "error"
+            workflow_log["error"] = str(e)
+            self._record_log(workflow_log)
+            yield "죄송합니다. 처리 중 오류가 발생했습니다. 다시 시도해주세요."
+    
+    async def _pipeline(self, service_type, input_data, emit, parallel=True):
+        """
+        3명의 전문가 워크플로우를 하나의 코루틴으로 실행
+        기초·실무 분석을 요청하고, 응답을 기다리는 동안 3단계 프롬프트를 미리 준비
+        Args:
+            service_type (str): 요청 서비스 유형
+            input_data (dict): 사용자 입력 데이터
+            emit (callable): emit(kind, payload) 이벤트 콜백
+                - ("chunk", (전문가 키, 응답 조각)): 스트리밍 응답 조각
+                - ("draft_done", 전문가 키): 해당 전문가의 분석 완료
+                - ("drafts_done", None): 기초·실무 분석 완료
+            parallel (bool): 기초·실무 분석을 동시에 실행할지 여부
+        Returns:
+            str: 최종 학습 가이드
+        """
+        drafts = asyncio.ensure_future(self._drafts(service_type, input_data, emit, parallel))
+        
+        # 1·2단계 응답을 기다리는 동안 3단계 서비스별 프롬프트를 별도 스레드에서 준비
+        learning_prompt = await asyncio.to_thread(
+            self.learning_expert._create_service_prompt, None, service_type, input_data
+        )
+        initial_explanation, practical_explanation = await drafts
+        emit("drafts_done", None)
+        
+        # 학습 경로 전문가에게는 두 전문가의 원문 대신 핵심 요약만 전달하여 입력 토큰 절감
+        combined_explanation = _COMBINED_EXPLANATION_TMPL.format(
+            foundations=_extract_summary(initial_explanation),
+            practical=_extract_summary(practical_explanation),
+        )
+        return await self.learning_expert.finalize(
+            combined_explanation, service_type, input_data,
+            on_chunk=lambda text: emit("chunk", ("learning", text)),
+            service_prompt=learning_prompt,
+        )
+    
+    async def _drafts(self, service_type, input_data, emit, parallel):
+        """
+        1·2단계 분석 실행
+        동시 실행 시 두 전문가가 독립적으로 분석하고, 순차 실행 시 실무 전문가가 기초 전문가의 설명 전체를 검토하여 보완
+        Returns:
+            tuple: (기초 개념 설명, 실무 응용 설명)
+        """
+        def on_chunk(key):
+            return lambda text: emit("chunk", (key, text))
+        
+        async def run(key, coro):
+            # 전문가별 완료 시점을 알리기 위해 응답이 끝나면 바로 이벤트 전달
+            result = await coro
+            emit("draft_done", key)
+            return result
+        
+        if parallel:
+            return await asyncio.gather(
+                run("foundations", self.foundations_expert.explain(
+                    service_type, input_data, on_chunk=on_chunk("foundations")
+                )),
+                run("practical", self.practical_expert.enhance(
+                    None, service_type, input_data, on_chunk=on_chunk("practical")
+                )),
+            )
+        initial_explanation = await run("foundations", self.foundations_expert.explain(
+            service_type, input_data, on_chunk=on_chunk("foundations")
+        ))
+        practical_explanation = await run("practical", self.practical_expert.enhance(
+            initial_explanation, service_type, input_data, on_chunk=on_chunk("practical")
+        ))
+        return initial_explanation, practical_explanation
+    
+    def get_draft_explanations(self, service_type, input_data, parallel=True):
+        """
+        완료된 요청의 1·2단계 전문가 분석 원문 조회 (최종 가이드와 함께 화면에 남기기 위해 세션에 저장)
+        Args:
+            service_type (str): 요청 서비스 유형
+            input_data (dict): 사용자 입력 데이터
+            parallel (bool): 기초·실무 분석을 동시에 실행했는지 여부
+        Returns:
+            dict | None: {"foundations": 기초 개념 설명, "practical": 실무 응용 설명} (저장된 분석이 없으면 None)
+        """
+        cache_key = _guide_cache_key(service_type, input_data, parallel)
+        return st.session_state.get("guide_drafts", {}).get(cache_key)
+    
+    def get_ai_education_batched(self, service_type, input_data):
+        """
+        3명의 전문가 역할을 하나의 프롬프트로 묶어 한 번의 AI 호출로 교육 지원 제공
+        구조화된 응답을 해석하지 못하면 전문가별 워크플로우(get_ai_education)로 대체
+        Args:
+            service_type (str): 요청 서비스 유형
+            input_data (dict): 사용자 입력 데이터
+        Returns:
+            str: 최종 교육 지원 결과
+        """
+        # 동일한 요청은 세션에 저장된 결과를 즉시 반환
+        cache_key = _guide_cache_key(service_type, input_data)
+        guides = st.session_state.setdefault("guides", {})
+        if cache_key in guides:
+            return guides[cache_key]
+        
+        # 워크플로우 기록 시작 (단계별 기록은 요청 시작 후 경과 시간으로 저장)
+        started = time.monotonic()
+        workflow_log = {
+            "service_type": service_type,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "experts_involved": ["AIFoundationsExpert", "PracticalAIExpert", "LearningPathExpert"],
+            "steps": [],
+            "status": "in_progress"
+        }
+        
+        try:
+            with st.spinner("3명의 전문가가 한 번의 요청으로 함께 분석 중입니다..."):
+                try:
+                    # 같은 API 키로 요청된 동일한 질문은 세션과 관계없이 저장된 결과를 재사용
+                    final_guidance = _run_education(self.api_key, service_type, tuple(sorted(input_data.items())))
+                except (ValueError, KeyError, TypeError):
+                    # 구조화된 응답을 해석할 수 없으면 전문가별 워크플로우로 대체
+                    final_guidance = None
+            
+            if final_guidance is None:
+                return self.get_ai_education(service_type, input_data)
+            
+            workflow_log["steps"].append({
+                "expert": "AIEducationTeam",
+                "action": "batched_generation",
+                "elapsed_ms": int((time.monotonic() - started) * 1000)
+            })
+            workflow_log["status"] = "completed"
+            self._record_log(workflow_log)
             
-            # 최종 결과 반환
+            # 완료된 결과만 캐시에 저장
+            guides[cache_key] = final_guidance
             return final_guidance
             
         except Exception as e:
             st.error(f"❌ 오류가 발생했습니다: {str(e)}")
             workflow_log["status"] = "error"
             workflow_log["error"] = str(e)
-            self.workflow_logs.append(workflow_log)
+            self._record_log(workflow_log)
             return "죄송합니다. 처리 중 오류가 발생했습니다. 다시 시도해주세요."
+    
+    def _generate_batched(self, service_type, input_data):
+        """
+        단일 요청으로 세 전문가의 결과를 생성하고 최종 학습 가이드만 반환 (화면 출력 없음)
+        Args:
+            service_type (str): 요청 서비스 유형
+            input_data (dict): 사용자 입력 데이터
+        Returns:
+            str: 최종 교육 지원 결과
+        Raises:
+            ValueError, KeyError, TypeError: 구조화된 응답을 해석할 수 없는 경우
+        """
+        # 세 전문가의 역할과 서비스별 지시를 하나의 프롬프트로 구성
+        prompt = _BATCHED_PROMPT_TMPL.format(
+            foundations_name=self.foundations_expert.expert_name,
+            foundations_intro=self.foundations_expert.expert_intro,
+            practical_name=self.practical_expert.expert_name,
+            practical_intro=self.practical_expert.expert_intro,
+            learning_name=self.learning_expert.expert_name,
+            learning_intro=self.learning_expert.expert_intro,
+            foundations_body=self.foundations_expert._create_service_prompt(service_type, input_data),
+            practical_body=self.practical_expert._create_service_prompt(None, service_type, input_data),
+            learning_body=self.learning_expert._create_service_prompt(None, service_type, input_data),
+        )
+        
+        response = _run_async(_generate(
+            self.model,
+            prompt,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": _BATCHED_RESPONSE_SCHEMA,
+            },
+        ))
+        return json.loads(response.text)["learning"]
+
+
+# AI 기초 개념 전문가 프롬프트 템플릿 (모듈 로드 시 한 번만 생성하고 사용자 입력만 채움)
+_CONCEPT_PROMPT_TMPL = """
+다음 AI 개념에 대해 기초적인 설명을 제공해주세요:
+
+{concept}
+
+다음 항목을 포함하는 기초 설명을 제공해주세요:
+1. 개념의 정의와 핵심 원리
+2. 역사적 배경과 발전 과정
+3. 작동 방식의 기본 원리
+4. 해당 기술이 속한 AI 분야에서의 위치
+5. 이해하기 쉬운 비유나 예시
+"""
+
+_TOOL_BASICS_PROMPT_TMPL = """
+다음 AI 도구의 기본 원리와 개념에 대해 설명해주세요:
+
+도구 이름:
+{tool_name}
+
+사용 목적:
+{purpose}
+
+다음 항목을 포함하는 기초 설명을 제공해주세요:
+1. 해당 도구가 기반하는 AI 기술 설명
+2. 핵심 작동 원리와 알고리즘
+3. 비슷한 도구들과의 차이점
+4. 기술적 한계와 주의사항
+5. 초보자가 이해해야 할 핵심 개념
+"""
+
+_LEARNING_BASICS_PROMPT_TMPL = """
+AI 학습을 위한 기초 개념과 배경 지식을 설명해주세요:
+
+현재 지식 수준:
+{current_level}
+
+학습 목표:
+{goals}
+
+다음 항목을 포함한 기초 설명을 제공해주세요:
+
+1. AI 학습을 위한 필수 기초 개념
+   - 기계학습의 핵심 원리
+   - 딥러닝과 신경망의 기초
+   - AI 모델 학습 과정의 이해
+
+2. 학습 목표를 위해 알아야 할 이론적 배경
+   - 관련 수학적/통계적 개념
+   - 프로그래밍 관련 기초 지식
+   - 데이터 관련 핵심 개념
+
+3. 학습 난이도와 선수 지식 설명
+   - 필수적으로 알아야 할 개념
+   - 추가적으로 도움이 될 배경 지식
+   - 개념 간의 연결성과 학습 순서
+"""
+
+_ETHICS_BASICS_PROMPT_TMPL = """
+AI 윤리 및 안전에 관한 기초 개념을 설명해주세요:
+
+관심 분야:
+{area_of_interest}
+
+다음 구조로 AI 윤리 및 안전의 기초 개념을 설명해주세요:
+
+1. AI 윤리의 기본 원칙
+   - 핵심 윤리적 프레임워크
+   - 주요 윤리적 고려사항
+   - 산업 표준과 가이드라인
+
+2. AI 안전의 기술적 기초
+   - 안전 관련 기술적 개념
+   - 주요 위험 요소와 취약점
+   - 안전 설계의 기본 원칙
+
+3. 법적/사회적 관점
+   - 관련 규제와 정책 동향
+   - 사회적 영향과 책임
+   - 투명성과 설명 가능성의 중요성
+"""
+
+_CS_SPEC_BASICS_PROMPT_TMPL = """
+CS 학생을 위한 스펙 가이드의 기초 개념과 이론적 배경을 설명해주세요:
+
+현재 상황:
+{current_situation}
+
+목표:
+{career_goals}
+
+다음 항목을 포함한 기초 설명을 제공해주세요:
+
+1. CS 전공의 핵심 기초 개념
+   - 컴퓨터과학의 기본 원리와 이론적 배경
+   - 프로그래밍 언어의 분류와 특징
+   - 자료구조와 알고리즘의 중요성
+   - 소프트웨어 개발 생명주기
+
+2. 학년별 필수 이론 지식
+   - 1-2학년: 기초 수학, 프로그래밍 기초, 컴퓨터 구조
+   - 3-4학년: 고급 알고리즘, 시스템 설계, 전공 심화
+   - 각 학년별로 필요한 수학적 배경과 이론적 기초
+
+3. 기술 스택의 이론적 이해
+   - 웹 개발: HTTP, REST API, 데이터베이스 이론
+   - 모바일 개발: 플랫폼별 아키텍처, 네이티브 vs 크로스플랫폼
+   - AI/ML: 머신러닝 이론, 통계학, 선형대수학
+   - 클라우드: 분산시스템, 마이크로서비스 아키텍처
+
+4. 학업 성취도와 GPA의 중요성
+   - 전공 GPA의 의미와 중요성
+   - 각 학년별 권장 GPA 목표
+   - 수학, 전공 과목의 가중치와 중요도
+"""
+
+_FOUNDATIONS_SYSTEM_TMPL = """
+당신은 '{name}'이라는 AI 기초 개념 전문가입니다.
+{intro}
+
+설명 결과에 핵심 개념과 이론적 배경을 반드시 포함해 주세요.
+가능한 한 복잡한 용어는 피하고, 초보자도 이해할 수 있는 명확한 설명을 제공하세요.
+"""
+
+_GENERAL_FOUNDATIONS_PROMPT_TMPL = """
+다음 {service_type} 요청에 대해 AI 기초 개념 관점에서 설명해주세요:
+
+요청 내용:
+{request}
+
+핵심 개념, 이론적 배경, 기술적 원리를 포함한 기초 설명을 제공해주세요.
+"""
 
 
 class AIFoundationsExpert:
@@ -151,8 +920,7 @@ class AIFoundationsExpert:
     인공지능 핵심 개념, 이론적 배경, 기술 원리 담당
     """
     
-    def __init__(self, model):
-        self.model = model
+    def __init__(self, api_key, model, generation_config=None):
         self.expertise = "ai_foundations"
         self.expert_name = "김민준 AI 기초 전문가"
         self.expert_intro = """
@@ -160,173 +928,221 @@ class AIFoundationsExpert:
         저는 인공지능의 핵심 개념과 이론적 배경을 쉽게 설명합니다.
         12년간 AI 연구와 교육 경험을 바탕으로 복잡한 개념을 명확하게 전달해 드리겠습니다.
         """
+        
+        # 전문가 소개와 공통 지시는 시스템 지시로 고정 (요청에는 서비스별 내용만 포함)
+        self.model = _derive_model(
+            api_key,
+            model,
+            _FOUNDATIONS_SYSTEM_TMPL.format(name=self.expert_name, intro=self.expert_intro) + _SUMMARY_INSTRUCTION,
+            generation_config,
+        )
     
-    def explain(self, service_type, input_data):
+    async def explain(self, service_type, input_data, on_chunk=None):
         """
         사용자 요청에 대한 AI 기초 개념 설명 제공
         """
         try:
             # 서비스 유형별 맞춤 프롬프트 생성
-            if service_type == "AI 개념 이해":
-                prompt = self._create_concept_prompt(input_data)
-            elif service_type == "AI 도구 사용법":
-                prompt = self._create_tool_basics_prompt(input_data)
-            elif service_type == "AI 학습 계획":
-                prompt = self._create_learning_basics_prompt(input_data)
-            elif service_type == "AI 윤리 및 안전":
-                prompt = self._create_ethics_basics_prompt(input_data)
-            elif service_type == "CS 학생 스펙 가이드":
-                prompt = self._create_cs_spec_basics_prompt(input_data)
-            else:
-                prompt = self._create_general_foundations_prompt(input_data, service_type)
+            prompt = self._create_service_prompt(service_type, input_data)
             
-            # 전문가 정보 추가
-            prompt = f"""
-            당신은 '{self.expert_name}'이라는 AI 기초 개념 전문가입니다.
-            {self.expert_intro}
-            
-            {prompt}
-            
-            설명 결과에 핵심 개념과 이론적 배경을 반드시 포함해 주세요.
-            가능한 한 복잡한 용어는 피하고, 초보자도 이해할 수 있는 명확한 설명을 제공하세요.
-            """
-            
-            # AI 모델을 통한 응답 생성
-            response = self.model.generate_content(prompt)
-            return response.text if response.text else "응답을 생성할 수 없습니다. 다시 시도해주세요."
+            # AI 모델을 통한 응답 생성 (스트리밍)
+            text = await _generate_streaming(self.model, prompt, on_chunk)
+            return text if text else "응답을 생성할 수 없습니다. 다시 시도해주세요."
             
         except Exception as e:
-            return f"기초 개념 설명 중 오류가 발생했습니다: {str(e)}"
+            # 오류 응답이 결과 캐시에 남지 않도록 상위 워크플로우로 전달
+            raise RuntimeError(f"기초 개념 설명 중 오류가 발생했습니다: {str(e)}") from e
     
-    def _create_concept_prompt(self, input_data):
-        return f"""
-        다음 AI 개념에 대해 기초적인 설명을 제공해주세요:
-        
-        {input_data.get('concept', '')}
-        
-        다음 항목을 포함하는 기초 설명을 제공해주세요:
-        1. 개념의 정의와 핵심 원리
-        2. 역사적 배경과 발전 과정
-        3. 작동 방식의 기본 원리
-        4. 해당 기술이 속한 AI 분야에서의 위치
-        5. 이해하기 쉬운 비유나 예시
+    def _create_service_prompt(self, service_type, input_data):
         """
+        서비스 유형에 맞는 프롬프트 생성 메서드 선택 (등록되지 않은 유형은 일반 프롬프트 사용)
+        """
+        builder = self.PROMPT_BUILDERS.get(service_type)
+        if builder is None:
+            return self._create_general_foundations_prompt(input_data, service_type)
+        return builder(self, input_data)
+    
+    def _create_concept_prompt(self, input_data):
+        return _CONCEPT_PROMPT_TMPL.format(concept=input_data.get('concept', ''))
     
     def _create_tool_basics_prompt(self, input_data):
-        return f"""
-        다음 AI 도구의 기본 원리와 개념에 대해 설명해주세요:
-        
-        도구 이름:
-        {input_data.get('tool_name', '')}
-        
-        사용 목적:
-        {input_data.get('purpose', '')}
-        
-        다음 항목을 포함하는 기초 설명을 제공해주세요:
-        1. 해당 도구가 기반하는 AI 기술 설명
-        2. 핵심 작동 원리와 알고리즘
-        3. 비슷한 도구들과의 차이점
-        4. 기술적 한계와 주의사항
-        5. 초보자가 이해해야 할 핵심 개념
-        """
+        return _TOOL_BASICS_PROMPT_TMPL.format(tool_name=input_data.get('tool_name', ''), purpose=input_data.get('purpose', ''))
     
     def _create_learning_basics_prompt(self, input_data):
-        return f"""
-        AI 학습을 위한 기초 개념과 배경 지식을 설명해주세요:
-        
-        현재 지식 수준:
-        {input_data.get('current_level', '')}
-        
-        학습 목표:
-        {input_data.get('goals', '')}
-        
-        다음 항목을 포함한 기초 설명을 제공해주세요:
-        
-        1. AI 학습을 위한 필수 기초 개념
-           - 기계학습의 핵심 원리
-           - 딥러닝과 신경망의 기초
-           - AI 모델 학습 과정의 이해
-        
-        2. 학습 목표를 위해 알아야 할 이론적 배경
-           - 관련 수학적/통계적 개념
-           - 프로그래밍 관련 기초 지식
-           - 데이터 관련 핵심 개념
-        
-        3. 학습 난이도와 선수 지식 설명
-           - 필수적으로 알아야 할 개념
-           - 추가적으로 도움이 될 배경 지식
-           - 개념 간의 연결성과 학습 순서
-        """
+        return _LEARNING_BASICS_PROMPT_TMPL.format(current_level=input_data.get('current_level', ''), goals=input_data.get('goals', ''))
     
     def _create_ethics_basics_prompt(self, input_data):
-        return f"""
-        AI 윤리 및 안전에 관한 기초 개념을 설명해주세요:
-        
-        관심 분야:
-        {input_data.get('area_of_interest', '')}
-        
-        다음 구조로 AI 윤리 및 안전의 기초 개념을 설명해주세요:
-        
-        1. AI 윤리의 기본 원칙
-           - 핵심 윤리적 프레임워크
-           - 주요 윤리적 고려사항
-           - 산업 표준과 가이드라인
-        
-        2. AI 안전의 기술적 기초
-           - 안전 관련 기술적 개념
-           - 주요 위험 요소와 취약점
-           - 안전 설계의 기본 원칙
-        
-        3. 법적/사회적 관점
-           - 관련 규제와 정책 동향
-           - 사회적 영향과 책임
-           - 투명성과 설명 가능성의 중요성
-        """
+        return _ETHICS_BASICS_PROMPT_TMPL.format(area_of_interest=input_data.get('area_of_interest', ''))
     
     def _create_cs_spec_basics_prompt(self, input_data):
-        return f"""
-        CS 학생을 위한 스펙 가이드의 기초 개념과 이론적 배경을 설명해주세요:
-        
-        현재 상황:
-        {input_data.get('current_situation', '')}
-        
-        목표:
-        {input_data.get('career_goals', '')}
-        
-        다음 항목을 포함한 기초 설명을 제공해주세요:
-        
-        1. CS 전공의 핵심 기초 개념
-           - 컴퓨터과학의 기본 원리와 이론적 배경
-           - 프로그래밍 언어의 분류와 특징
-           - 자료구조와 알고리즘의 중요성
-           - 소프트웨어 개발 생명주기
-        
-        2. 학년별 필수 이론 지식
-           - 1-2학년: 기초 수학, 프로그래밍 기초, 컴퓨터 구조
-           - 3-4학년: 고급 알고리즘, 시스템 설계, 전공 심화
-           - 각 학년별로 필요한 수학적 배경과 이론적 기초
-        
-        3. 기술 스택의 이론적 이해
-           - 웹 개발: HTTP, REST API, 데이터베이스 이론
-           - 모바일 개발: 플랫폼별 아키텍처, 네이티브 vs 크로스플랫폼
-           - AI/ML: 머신러닝 이론, 통계학, 선형대수학
-           - 클라우드: 분산시스템, 마이크로서비스 아키텍처
-        
-        4. 학업 성취도와 GPA의 중요성
-           - 전공 GPA의 의미와 중요성
-           - 각 학년별 권장 GPA 목표
-           - 수학, 전공 과목의 가중치와 중요도
-        """
+        return _CS_SPEC_BASICS_PROMPT_TMPL.format(current_situation=input_data.get('current_situation', ''), career_goals=input_data.get('career_goals', ''))
     
     def _create_general_foundations_prompt(self, input_data, service_type):
-        return f"""
-        다음 {service_type} 요청에 대해 AI 기초 개념 관점에서 설명해주세요:
-        
-        요청 내용:
-        {str(input_data)}
-        
-        핵심 개념, 이론적 배경, 기술적 원리를 포함한 기초 설명을 제공해주세요.
-        """
+        return _GENERAL_FOUNDATIONS_PROMPT_TMPL.format(service_type=service_type, request=_fmt(input_data))
+    
+    # 서비스 유형별 프롬프트 생성 메서드
+    PROMPT_BUILDERS = {
+        "AI 개념 이해": _create_concept_prompt,
+        "AI 도구 사용법": _create_tool_basics_prompt,
+        "AI 학습 계획": _create_learning_basics_prompt,
+        "AI 윤리 및 안전": _create_ethics_basics_prompt,
+        "CS 학생 스펙 가이드": _create_cs_spec_basics_prompt,
+    }
+
+
+# 실무 응용 전문가 프롬프트 템플릿 (모듈 로드 시 한 번만 생성하고 사용자 입력만 채움)
+_CONCEPT_PRACTICAL_PROMPT_TMPL = """
+다음 AI 개념의 실무 활용 사례와 적용 방법을 제시해주세요:
+
+1. 해당 개념의 주요 산업별 활용 사례
+   - 기술 기업에서의 활용법
+   - 금융, 의료, 교육 등 다양한 분야의 적용 예시
+   - 스타트업과 대기업의 적용 차이
+
+2. 실제 구현 시 고려사항
+   - 일반적인 구현 과정과 단계
+   - 자주 발생하는 문제점과 해결 방법
+   - 필요한 인프라 및 리소스
+
+3. 최신 트렌드와 미래 전망
+   - 현재 업계 동향과 기술 발전 방향
+   - 주목할 만한 혁신 사례
+   - 미래 잠재적 응용 분야
+
+대상 개념:
+{concept}
+"""
+
+_TOOL_PRACTICAL_PROMPT_TMPL = """
+다음 AI 도구의 실전 사용법과 활용 사례를 제시해주세요:
+
+1. 도구의 실제 사용 시나리오
+   - 일반적인 사용 워크플로우
+   - 효과적인 활용을 위한 설정 및 팁
+   - 고급 활용법과 숨겨진 기능
+
+2. 산업별 활용 사례
+   - 대표적인 성공 사례 분석
+   - 실제 비즈니스 가치와 ROI
+   - 사용자 피드백과 평가
+
+3. 유사 도구와의 비교 및 통합
+   - 경쟁 도구와의 장단점 비교
+   - 다른 AI 도구와의 통합 방법
+   - 생태계 내 위치와 호환성
+
+도구 이름:
+{tool_name}
+
+사용 목적:
+{purpose}
+"""
+
+_LEARNING_PRACTICAL_PROMPT_TMPL = """
+AI 학습을 위한 실무 중심 접근법과 실전 적용 방법을 제안해주세요:
+
+1. 실무 중심 학습 방법론
+   - 프로젝트 기반 학습 접근법
+   - 실제 문제 해결을 통한 학습 전략
+   - 업계 표준 도구 및 워크플로우 습득법
+
+2. 실전 경험 구축 방법
+   - 포트폴리오 프로젝트 아이디어
+   - 오픈소스 기여 및 커뮤니티 참여 방법
+   - 인턴십 및 실무 경험 확보 전략
+
+3. 업계 연결 및 네트워킹
+   - 주요 커뮤니티 및 컨퍼런스 소개
+   - 전문가 네트워킹 구축 방법
+   - AI 분야 취업/전환 준비 전략
+
+현재 지식 수준:
+{current_level}
+
+학습 목표:
+{goals}
+"""
+
+_ETHICS_PRACTICAL_PROMPT_TMPL = """
+AI 윤리 및 안전의 실무 적용 방법과 사례를 제시해주세요:
+
+1. 윤리적 설계 및 개발 실무
+   - 윤리적 AI 개발 프로세스 및 프레임워크
+   - 실제 프로젝트에서의 윤리적 검토 방법
+   - 윤리적 문제 발견 및 해결 사례
+
+2. 규제 준수 및 거버넌스
+   - 주요 규제 준수 전략
+   - 윤리위원회 및 감독 메커니즘 구축
+   - 문서화 및 투명성 확보 방법
+
+3. 현업 사례 분석
+   - 윤리적 문제로 인한 실패 사례
+   - 성공적인 윤리적 AI 구현 사례
+   - 업계별 특수한 윤리적 고려사항
+
+관심 분야:
+{area_of_interest}
+"""
+
+_CS_SPEC_PRACTICAL_PROMPT_TMPL = """
+CS 학생을 위한 스펙 가이드의 실무 적용 사례와 업계 동향을 제시해주세요:
+
+현재 상황:
+{current_situation}
+
+목표:
+{career_goals}
+
+다음 항목을 포함한 실무 관점의 설명을 제공해주세요:
+
+1. 업계별 실제 요구사항과 스펙
+   - 빅테크 (구글, 마이크로소프트, 아마존): 알고리즘, 시스템 설계, 클라우드
+   - 스타트업: 풀스택 개발, 빠른 학습 능력, 다양한 기술 스택
+   - 금융/핀테크: 보안, 규정 준수, 고성능 시스템
+   - 게임/엔터테인먼트: 실시간 처리, 그래픽스, 최적화
+
+2. 학년별 실무 경험 구축 방법
+   - 1-2학년: 개인 프로젝트, 해커톤 참여, 오픈소스 기여
+   - 3-4학년: 인턴십, 대회 참여, 스타트업 아르바이트
+   - 졸업 후: 포트폴리오 구축, 네트워킹, 기술 블로그
+
+3. 실제 채용 프로세스와 평가 기준
+   - 코딩 테스트: 알고리즘, 자료구조, 문제 해결 능력
+   - 기술 면접: 시스템 설계, 아키텍처, 트레이드오프
+   - 포트폴리오: 프로젝트의 기술적 깊이와 비즈니스 임팩트
+   - 소프트 스킬: 커뮤니케이션, 팀워크, 학습 능력
+
+4. 최신 기술 트렌드와 업계 동향
+   - AI/ML: MLOps, LLM, 생성형 AI
+   - 클라우드: 멀티클라우드, 서버리스, 컨테이너
+   - 웹 개발: JAMstack, 마이크로프론트엔드, WebAssembly
+   - 모바일: 크로스플랫폼, PWA, 모바일 최적화
+"""
+
+_PRACTICAL_REVIEW_TMPL = """
+AI 기초 전문가가 제공한 다음 설명을 검토하고, 실무 응용 관점에서 보완해주세요:
+
+=== 기초 전문가의 설명 ===
+{previous_explanation}
+=== 설명 끝 ===
+"""
+
+_PRACTICAL_SYSTEM_TMPL = """
+당신은 '{name}'이라는 AI 실무 응용 전문가입니다.
+{intro}
+
+구체적인 실무 사례, 적용 방법, 업계 동향과 트렌드를 반드시 포함해 주세요.
+"""
+
+_GENERAL_PRACTICAL_PROMPT_TMPL = """
+다음 {service_type} 요청에 대해 AI 실무 응용 관점에서 분석해주세요:
+
+요청 내용:
+{request}
+
+실제 활용 사례, 구현 방법, 업계 트렌드를 구체적으로 제시해주세요.
+"""
 
 
 class PracticalAIExpert:
@@ -335,8 +1151,7 @@ class PracticalAIExpert:
     AI 활용 사례, 실무 적용 방법, 현업 통찰력 제공 담당
     """
     
-    def __init__(self, model):
-        self.model = model
+    def __init__(self, api_key, model, generation_config=None):
         self.expertise = "practical_applications"
         self.expert_name = "박서연 실무 응용 전문가"
         self.expert_intro = """
@@ -344,192 +1159,277 @@ class PracticalAIExpert:
         저는 AI의 실무 적용 방법과 현업 사례를 전문으로 합니다.
         10년간의 AI 프로젝트 구현 및 컨설팅 경험을 통해 이론을 실제로 적용하는 방법을 안내해 드리겠습니다.
         """
+        
+        # 전문가 소개와 공통 지시는 시스템 지시로 고정 (요청에는 서비스별 내용만 포함)
+        self.model = _derive_model(
+            api_key,
+            model,
+            _PRACTICAL_SYSTEM_TMPL.format(name=self.expert_name, intro=self.expert_intro) + _SUMMARY_INSTRUCTION,
+            generation_config,
+        )
     
-    def enhance(self, previous_explanation, service_type, input_data):
+    async def enhance(self, previous_explanation, service_type, input_data, on_chunk=None):
         """
         기초 전문가의 설명을 바탕으로 실무 응용 관점의 내용 추가
+        previous_explanation이 없으면 기초 분석과 동시에 실행되는 독립적인 실무 분석을 제공
         """
         try:
             # 서비스 유형별 맞춤 프롬프트 생성
-            if service_type == "AI 개념 이해":
-                prompt = self._create_concept_practical_prompt(previous_explanation, input_data)
-            elif service_type == "AI 도구 사용법":
-                prompt = self._create_tool_practical_prompt(previous_explanation, input_data)
-            elif service_type == "AI 학습 계획":
-                prompt = self._create_learning_practical_prompt(previous_explanation, input_data)
-            elif service_type == "AI 윤리 및 안전":
-                prompt = self._create_ethics_practical_prompt(previous_explanation, input_data)
-            elif service_type == "CS 학생 스펙 가이드":
-                prompt = self._create_cs_spec_practical_prompt(previous_explanation, input_data)
-            else:
-                prompt = self._create_general_practical_prompt(previous_explanation, input_data, service_type)
-            
-            # 전문가 정보 추가
-            prompt = f"""
-            당신은 '{self.expert_name}'이라는 AI 실무 응용 전문가입니다.
-            {self.expert_intro}
-            
-            AI 기초 전문가가 제공한 다음 설명을 검토하고, 실무 응용 관점에서 보완해주세요:
-            
-            === 기초 전문가의 설명 ===
-            {previous_explanation}
-            === 설명 끝 ===
-            
-            {prompt}
+            prompt = self._create_service_prompt(previous_explanation, service_type, input_data)
             
-            구체적인 실무 사례, 적용 방법, 업계 동향과 트렌드를 반드시 포함해 주세요.
-            """
+            # 기초 전문가의 설명이 있으면 검토 대상으로 포함
+            if previous_explanation:
+                prompt = _PRACTICAL_REVIEW_TMPL.format(previous_explanation=previous_explanation) + prompt
             
-            # AI 모델을 통한 응답 생성
-            response = self.model.generate_content(prompt)
-            return response.text if response.text else "실무 응용 설명을 생성할 수 없습니다. 다시 시도해주세요."
+            # AI 모델을 통한 응답 생성 (스트리밍)
+            text = await _generate_streaming(self.model, prompt, on_chunk)
+            return text if text else "실무 응용 설명을 생성할 수 없습니다. 다시 시도해주세요."
             
         except Exception as e:
-            return f"실무 응용 설명 중 오류가 발생했습니다: {str(e)}"
+            # 오류 응답이 결과 캐시에 남지 않도록 상위 워크플로우로 전달
+            raise RuntimeError(f"실무 응용 설명 중 오류가 발생했습니다: {str(e)}") from e
     
-    def _create_concept_practical_prompt(self, previous_explanation, input_data):
-        return f"""
-        앞서 설명된 AI 개념의 실무 활용 사례와 적용 방법을 제시해주세요:
-        
-        1. 해당 개념의 주요 산업별 활용 사례
-           - 기술 기업에서의 활용법
-           - 금융, 의료, 교육 등 다양한 분야의 적용 예시
-           - 스타트업과 대기업의 적용 차이
-        
-        2. 실제 구현 시 고려사항
-           - 일반적인 구현 과정과 단계
-           - 자주 발생하는 문제점과 해결 방법
-           - 필요한 인프라 및 리소스
-        
-        3. 최신 트렌드와 미래 전망
-           - 현재 업계 동향과 기술 발전 방향
-           - 주목할 만한 혁신 사례
-           - 미래 잠재적 응용 분야
-        
-        원본 개념:
-        {input_data.get('concept', '')}
+    def _create_service_prompt(self, previous_explanation, service_type, input_data):
+        """
+        서비스 유형에 맞는 프롬프트 생성 메서드 선택 (등록되지 않은 유형은 일반 프롬프트 사용)
         """
+        builder = self.PROMPT_BUILDERS.get(service_type)
+        if builder is None:
+            return self._create_general_practical_prompt(previous_explanation, input_data, service_type)
+        return builder(self, previous_explanation, input_data)
+    
+    def _create_concept_practical_prompt(self, previous_explanation, input_data):
+        return _CONCEPT_PRACTICAL_PROMPT_TMPL.format(concept=input_data.get('concept', ''))
     
     def _create_tool_practical_prompt(self, previous_explanation, input_data):
-        return f"""
-        앞서 설명된 AI 도구의 실전 사용법과 활용 사례를 제시해주세요:
-        
-        1. 도구의 실제 사용 시나리오
-           - 일반적인 사용 워크플로우
-           - 효과적인 활용을 위한 설정 및 팁
-           - 고급 활용법과 숨겨진 기능
-        
-        2. 산업별 활용 사례
-           - 대표적인 성공 사례 분석
-           - 실제 비즈니스 가치와 ROI
-           - 사용자 피드백과 평가
-        
-        3. 유사 도구와의 비교 및 통합
-           - 경쟁 도구와의 장단점 비교
-           - 다른 AI 도구와의 통합 방법
-           - 생태계 내 위치와 호환성
-        
-        도구 이름:
-        {input_data.get('tool_name', '')}
-        
-        사용 목적:
-        {input_data.get('purpose', '')}
-        """
+        return _TOOL_PRACTICAL_PROMPT_TMPL.format(tool_name=input_data.get('tool_name', ''), purpose=input_data.get('purpose', ''))
     
     def _create_learning_practical_prompt(self, previous_explanation, input_data):
-        return f"""
-        AI 학습을 위한 실무 중심 접근법과 실전 적용 방법을 제안해주세요:
-        
-        1. 실무 중심 학습 방법론
-           - 프로젝트 기반 학습 접근법
-           - 실제 문제 해결을 통한 학습 전략
-           - 업계 표준 도구 및 워크플로우 습득법
-        
-        2. 실전 경험 구축 방법
-           - 포트폴리오 프로젝트 아이디어
-           - 오픈소스 기여 및 커뮤니티 참여 방법
-           - 인턴십 및 실무 경험 확보 전략
-        
-        3. 업계 연결 및 네트워킹
-           - 주요 커뮤니티 및 컨퍼런스 소개
-           - 전문가 네트워킹 구축 방법
-           - AI 분야 취업/전환 준비 전략
-        
-        현재 지식 수준:
-        {input_data.get('current_level', '')}
-        
-        학습 목표:
-        {input_data.get('goals', '')}
-        """
+        return _LEARNING_PRACTICAL_PROMPT_TMPL.format(current_level=input_data.get('current_level', ''), goals=input_data.get('goals', ''))
     
     def _create_ethics_practical_prompt(self, previous_explanation, input_data):
-        return f"""
-        AI 윤리 및 안전의 실무 적용 방법과 사례를 제시해주세요:
-        
-        1. 윤리적 설계 및 개발 실무
-           - 윤리적 AI 개발 프로세스 및 프레임워크
-           - 실제 프로젝트에서의 윤리적 검토 방법
-           - 윤리적 문제 발견 및 해결 사례
-        
-        2. 규제 준수 및 거버넌스
-           - 주요 규제 준수 전략
-           - 윤리위원회 및 감독 메커니즘 구축
-           - 문서화 및 투명성 확보 방법
-        
-        3. 현업 사례 분석
-           - 윤리적 문제로 인한 실패 사례
-           - 성공적인 윤리적 AI 구현 사례
-           - 업계별 특수한 윤리적 고려사항
-        
-        관심 분야:
-        {input_data.get('area_of_interest', '')}
-        """
+        return _ETHICS_PRACTICAL_PROMPT_TMPL.format(area_of_interest=input_data.get('area_of_interest', ''))
     
     def _create_cs_spec_practical_prompt(self, previous_explanation, input_data):
-        return f"""
-        CS 학생을 위한 스펙 가이드의 실무 적용 사례와 업계 동향을 제시해주세요:
-        
-        현재 상황:
-        {input_data.get('current_situation', '')}
-        
-        목표:
-        {input_data.get('career_goals', '')}
-        
-        다음 항목을 포함한 실무 관점의 설명을 제공해주세요:
-        
-        1. 업계별 실제 요구사항과 스펙
-           - 빅테크 (구글, 마이크로소프트, 아마존): 알고리즘, 시스템 설계, 클라우드
-           - 스타트업: 풀스택 개발, 빠른 학습 능력, 다양한 기술 스택
-           - 금융/핀테크: 보안, 규정 준수, 고성능 시스템
-           - 게임/엔터테인먼트: 실시간 처리, 그래픽스, 최적화
-        
-        2. 학년별 실무 경험 구축 방법
-           - 1-2학년: 개인 프로젝트, 해커톤 참여, 오픈소스 기여
-           - 3-4학년: 인턴십, 대회 참여, 스타트업 아르바이트
-           - 졸업 후: 포트폴리오 구축, 네트워킹, 기술 블로그
-        
-        3. 실제 채용 프로세스와 평가 기준
-           - 코딩 테스트: 알고리즘, 자료구조, 문제 해결 능력
-           - 기술 면접: 시스템 설계, 아키텍처, 트레이드오프
-           - 포트폴리오: 프로젝트의 기술적 깊이와 비즈니스 임팩트
-           - 소프트 스킬: 커뮤니케이션, 팀워크, 학습 능력
-        
-        4. 최신 기술 트렌드와 업계 동향
-           - AI/ML: MLOps, LLM, 생성형 AI
-           - 클라우드: 멀티클라우드, 서버리스, 컨테이너
-           - 웹 개발: JAMstack, 마이크로프론트엔드, WebAssembly
-           - 모바일: 크로스플랫폼, PWA, 모바일 최적화
-        """
+        return _CS_SPEC_PRACTICAL_PROMPT_TMPL.format(current_situation=input_data.get('current_situation', ''), career_goals=input_data.get('career_goals', ''))
     
     def _create_general_practical_prompt(self, previous_explanation, input_data, service_type):
-        return f"""
-        다음 {service_type} 요청에 대해 AI 실무 응용 관점에서 분석해주세요:
-        
-        요청 내용:
-        {str(input_data)}
-        
-        실제 활용 사례, 구현 방법, 업계 트렌드를 구체적으로 제시해주세요.
-        """
+        return _GENERAL_PRACTICAL_PROMPT_TMPL.format(service_type=service_type, request=_fmt(input_data))
+    
+    # 서비스 유형별 프롬프트 생성 메서드
+    PROMPT_BUILDERS = {
+        "AI 개념 이해": _create_concept_practical_prompt,
+        "AI 도구 사용법": _create_tool_practical_prompt,
+        "AI 학습 계획": _create_learning_practical_prompt,
+        "AI 윤리 및 안전": _create_ethics_practical_prompt,
+        "CS 학생 스펙 가이드": _create_cs_spec_practical_prompt,
+    }
+
+
+# 학습 경로 전문가 프롬프트 템플릿 (모듈 로드 시 한 번만 생성하고 사용자 입력만 채움)
+_CONCEPT_LEARNING_PROMPT_TMPL = """
+해당 AI 개념을 효과적으로 학습하기 위한 맞춤형 학습 경로를 제안해주세요:
+
+1. 단계별 학습 계획
+   - 초보자부터 전문가까지의 학습 단계
+   - 각 단계별 핵심 목표와 성취 지표
+   - 예상 소요 시간과 난이도
+
+2. 최적의 학습 자원
+   - 추천 온라인 강의, 책, 튜토리얼
+   - 무료 및 유료 자원 균형있는 추천
+   - 자기주도 학습 vs 지도 학습 옵션
+
+3. 실습 및 응용 프로젝트
+   - 단계별 핸즈온 프로젝트 아이디어
+   - 학습 내용 검증을 위한 미니 프로젝트
+   - 포트폴리오에 추가할 수 있는 응용 과제
+
+4. 학습 진행 측정 및 피드백 방법
+   - 자가 평가 방법
+   - 지식 검증 및 진단 도구
+   - 커뮤니티 피드백 활용법
+
+원본 개념:
+{concept}
+"""
+
+_TOOL_LEARNING_PROMPT_TMPL = """
+해당 AI 도구의 숙련도를 높이기 위한 학습 경로를 제안해주세요:
+
+1. 도구 숙련 로드맵
+   - 초보자부터 전문가까지의 학습 단계
+   - 단계별 기능 익히기 순서
+   - 숙련도 수준별 목표와 평가 방법
+
+2. 실습 중심 학습 계획
+   - 핵심 기능별 실습 과제
+   - 난이도별 프로젝트 아이디어
+   - 실전 시나리오 기반 연습
+
+3. 보완 학습 자원
+   - 공식 및 비공식 문서와 튜토리얼
+   - 커뮤니티 및 포럼 활용법
+   - 전문가 인사이트 및 고급 팁 확보 방법
+
+4. 지속적 역량 개발 전략
+   - 최신 기능 및 업데이트 학습법
+   - 관련 도구 및 확장 기술 습득
+   - 전문성 증명 및 인증 방법
+
+도구 이름:
+{tool_name}
+
+사용 목적:
+{purpose}
+"""
+
+_COMPREHENSIVE_LEARNING_PROMPT_TMPL = """
+목표 달성을 위한 종합적인 AI 학습 로드맵을 제안해주세요:
+
+1. 개인화된 학습 경로
+   - 현재 수준에서 목표까지의 단계별 계획
+   - 학습자 특성에 맞는 접근법 및 방법론
+   - 단기/중기/장기 목표 설정 및 마일스톤
+
+2. 핵심 학습 자원 큐레이션
+   - 온라인 코스, 책, 튜토리얼 등 선별된 자원
+   - 품질과 적합성 기준의 자원 평가
+   - 비용 효율적인 학습 자원 활용 전략
+
+3. 실전 경험 구축 프레임워크
+   - 단계적 프로젝트 구성 계획
+   - 포트폴리오 구축 전략
+   - 실전 환경 시뮬레이션 및 연습 방법
+
+4. 지속적 피드백 및 개선 시스템
+   - 진행 상황 모니터링 및 평가 방법
+   - 멘토십 및 코칭 활용 전략
+   - 학습 습관 및 효율성 개선 방법
+
+5. 학습 여정 시간표
+   - 주간/월간/분기별 학습 일정 제안
+   - 시간 관리 및 학습 균형 전략
+   - 장애물 극복 및 동기 유지 방법
+
+현재 지식 수준:
+{current_level}
+
+학습 목표:
+{goals}
+"""
+
+_ETHICS_LEARNING_PROMPT_TMPL = """
+AI 윤리 및 안전에 대한 체계적인 학습 경로를 제안해주세요:
+
+1. 윤리적 AI 역량 개발 로드맵
+   - 기초부터 고급까지의 학습 단계
+   - 역할별 필요 지식과 역량(개발자/관리자/정책입안자)
+   - 윤리적 사고방식과 평가 능력 개발
+
+2. 추천 학습 자원
+   - 교재, 온라인 코스, 케이스 스터디
+   - 윤리적 프레임워크 및 도구
+   - 인증 및 전문가 과정
+
+3. 실습 및 토론 기반 학습
+   - 윤리적 딜레마 시나리오 분석
+   - 그룹 토론 및 사례 연구 방법
+   - 윤리적 감사 및 평가 실습
+
+4. 지속적인 역량 발전 계획
+   - 윤리적 AI 분야 최신 동향 파악 방법
+   - 전문가 커뮤니티 및 컨퍼런스 참여
+   - 자기 평가 및 성찰 방법론
+
+관심 분야:
+{area_of_interest}
+"""
+
+_CS_SPEC_LEARNING_PROMPT_TMPL = """
+CS 학생을 위한 맞춤형 스펙 구축 학습 경로를 제안해주세요:
+
+현재 상황:
+{current_situation}
+
+목표:
+{career_goals}
+
+다음 구조로 구체적인 학습 경로를 제안해주세요:
+
+1. 단계별 스펙 구축 로드맵
+   - 1단계 (1-3개월): 기초 기술 스택 완성
+   - 2단계 (3-6개월): 프로젝트 경험 쌓기
+   - 3단계 (6-12개월): 전문 분야 심화
+   - 4단계 (12개월+): 포트폴리오 완성 및 취업 준비
+
+2. 학년별 구체적인 학습 계획
+   - 1학년: 프로그래밍 기초, 수학 기초, 컴퓨터 구조
+   - 2학년: 자료구조/알고리즘, 웹 개발 기초, 데이터베이스
+   - 3학년: 프레임워크 숙련, 클라우드 기초, 인턴십 준비
+   - 4학년: 전문 분야 심화, 포트폴리오 완성, 취업 준비
+
+3. 추천 학습 자원과 도구
+   - 온라인 강의: Coursera, edX, Udemy, 인프런
+   - 책: 각 분야별 필수 서적과 참고서
+   - 실습 환경: GitHub, AWS Free Tier, Docker
+   - 커뮤니티: Stack Overflow, Reddit, 기술 블로그
+
+4. 프로젝트 포트폴리오 구축 전략
+   - 개인 프로젝트: 3-5개의 완성된 프로젝트
+   - 오픈소스 기여: GitHub 활동, 기여도 증명
+   - 기술 블로그: 학습 과정과 프로젝트 기록
+   - 대회 참여: 해커톤, 알고리즘 대회, 해커랭크
+
+5. GPA 관리 및 학업 전략
+   - 전공 과목 우선순위와 학습 방법
+   - 수학 과목의 중요성과 학습 전략
+   - 프로젝트와 학업의 균형 맞추기
+   - 각 학년별 목표 GPA 설정
+
+6. 취업 준비 체크리스트
+   - 이력서 작성: 기술 스택, 프로젝트 경험
+   - 포트폴리오 사이트: GitHub Pages, 개인 웹사이트
+   - 코딩 테스트 준비: LeetCode, 프로그래머스
+   - 면접 준비: 기술 면접, 시스템 설계, 행동 면접
+
+7. 네트워킹과 커리어 개발
+   - 기술 컨퍼런스 참여: PyCon, JSConf, AWS Summit
+   - 멘토링: 선배, 교수, 업계 전문가
+   - 인턴십 신청: 대기업, 스타트업, 중견기업
+   - 자격증 취득: AWS, Google Cloud, 정보처리기사
+"""
+
+_LEARNING_REVIEW_TMPL = """
+기초 전문가와 실무 응용 전문가가 제공한, 다음 설명을 검토하고 최종적으로 학습 경로를 완성해주세요:
+
+=== 이전 전문가들의 설명 ===
+{previous_explanation}
+=== 설명 끝 ===
+
+{body}
+"""
+
+_LEARNING_SYSTEM_TMPL = """
+당신은 '{name}'이라는 학습 경로 전문가입니다.
+{intro}
+
+최종 안내에는 다음 세 전문가의 관점이 균형있게 통합되어야 합니다:
+1. 기초 개념 전문가 (핵심 개념과 이론적 배경)
+2. 실무 응용 전문가 (실제 적용 사례와 업계 통찰력)
+3. 학습 경로 전문가 (개인화된 학습 계획과 자원)
+
+명확하고 실행 가능한 단계별 학습 가이드를 제공해주세요.
+"""
+
+_GENERAL_LEARNING_PROMPT_TMPL = """
+다음 {service_type} 요청에 대해 학습 경로 관점에서 맞춤형 계획을 제안해주세요:
+
+요청 내용:
+{request}
+
+체계적인 학습 단계, 추천 자원, 실습 계획, 진행 평가 방법을 구체적으로 제시해주세요.
+"""
 
 
 class LearningPathExpert:
@@ -538,8 +1438,7 @@ class LearningPathExpert:
     맞춤형 학습 계획, 교육 자원, 성장 로드맵 설계 담당
     """
     
-    def __init__(self, model):
-        self.model = model
+    def __init__(self, api_key, model, generation_config=None):
         self.expertise = "learning_pathways"
         self.expert_name = "이준호 학습 경로 전문가"
         self.expert_intro = """
@@ -547,247 +1446,458 @@ class LearningPathExpert:
         저는 AI 학습 계획 수립과 성장 로드맵 설계를 전문으로 합니다.
         15년간의 교육 경험을 바탕으로 여러분에게 최적화된 학습 경로를 제안해 드리겠습니다.
         """
+        
+        # 전문가 소개와 공통 지시는 시스템 지시로 고정 (요청에는 서비스별 내용만 포함)
+        self.model = _derive_model(
+            api_key,
+            model,
+            _LEARNING_SYSTEM_TMPL.format(name=self.expert_name, intro=self.expert_intro),
+            generation_config,
+        )
     
-    def finalize(self, previous_explanation, service_type, input_data):
+    async def finalize(self, previous_explanation, service_type, input_data, on_chunk=None, service_prompt=None):
         """
         기초 전문가와 실무 전문가의 설명을 바탕으로 최종 학습 경로 제안
+        service_prompt가 주어지면 미리 준비된 서비스별 프롬프트를 그대로 사용
         """
         try:
             # 서비스 유형별 맞춤 프롬프트 생성
-            if service_type == "AI 개념 이해":
-                prompt = self._create_concept_learning_prompt(previous_explanation, input_data)
-            elif service_type == "AI 도구 사용법":
-                prompt = self._create_tool_learning_prompt(previous_explanation, input_data)
-            elif service_type == "AI 학습 계획":
-                prompt = self._create_comprehensive_learning_prompt(previous_explanation, input_data)
-            elif service_type == "AI 윤리 및 안전":
-                prompt = self._create_ethics_learning_prompt(previous_explanation, input_data)
-            elif service_type == "CS 학생 스펙 가이드":
-                prompt = self._create_cs_spec_learning_prompt(previous_explanation, input_data)
-            else:
-                prompt = self._create_general_learning_prompt(previous_explanation, input_data, service_type)
-            
-            # 전문가 정보 추가
-            prompt = f"""
-            당신은 '{self.expert_name}'이라는 학습 경로 전문가입니다.
-            {self.expert_intro}
-            
-            기초 전문가와 실무 응용 전문가가 제공한, 다음 설명을 검토하고 최종적으로 학습 경로를 완성해주세요:
-            
-            === 이전 전문가들의 설명 ===
-            {previous_explanation}
-            === 설명 끝 ===
-            
-            {prompt}
-            
-            최종 안내에는 다음 세 전문가의 관점이 균형있게 통합되어야 합니다:
-            1. 기초 개념 전문가 (핵심 개념과 이론적 배경)
-            2. 실무 응용 전문가 (실제 적용 사례와 업계 통찰력)
-            3. 학습 경로 전문가 (개인화된 학습 계획과 자원)
+            prompt = service_prompt or self._create_service_prompt(previous_explanation, service_type, input_data)
             
-            명확하고 실행 가능한 단계별 학습 가이드를 제공해주세요.
-            """
+            # 이전 전문가들의 설명을 검토 대상으로 포함
+            prompt = _LEARNING_REVIEW_TMPL.format(previous_explanation=previous_explanation, body=prompt)
             
-            # AI 모델을 통한 응답 생성
-            response = self.model.generate_content(prompt)
-            return response.text if response.text else "학습 경로를 생성할 수 없습니다. 다시 시도해주세요."
+            # AI 모델을 통한 응답 생성 (스트리밍)
+            text = await _generate_streaming(self.model, prompt, on_chunk)
+            return text if text else "학습 경로를 생성할 수 없습니다. 다시 시도해주세요."
             
         except Exception as e:
-            return f"학습 경로 생성 중 오류가 발생했습니다: {str(e)}"
+            # 오류 응답이 결과 캐시에 남지 않도록 상위 워크플로우로 전달
+            raise RuntimeError(f"학습 경로 생성 중 오류가 발생했습니다: {str(e)}") from e
     
-    def _create_concept_learning_prompt(self, previous_explanation, input_data):
-        return f"""
-        해당 AI 개념을 효과적으로 학습하기 위한 맞춤형 학습 경로를 제안해주세요:
-        
-        1. 단계별 학습 계획
-           - 초보자부터 전문가까지의 학습 단계
-           - 각 단계별 핵심 목표와 성취 지표
-           - 예상 소요 시간과 난이도
-        
-        2. 최적의 학습 자원
-           - 추천 온라인 강의, 책, 튜토리얼
-           - 무료 및 유료 자원 균형있는 추천
-           - 자기주도 학습 vs 지도 학습 옵션
-        
-        3. 실습 및 응용 프로젝트
-           - 단계별 핸즈온 프로젝트 아이디어
-           - 학습 내용 검증을 위한 미니 프로젝트
-           - 포트폴리오에 추가할 수 있는 응용 과제
-        
-        4. 학습 진행 측정 및 피드백 방법
-           - 자가 평가 방법
-           - 지식 검증 및 진단 도구
-           - 커뮤니티 피드백 활용법
-        
-        원본 개념:
-        {input_data.get('concept', '')}
+    def _create_service_prompt(self, previous_explanation, service_type, input_data):
         """
+        서비스 유형에 맞는 프롬프트 생성 메서드 선택 (등록되지 않은 유형은 일반 프롬프트 사용)
+        """
+        builder = self.PROMPT_BUILDERS.get(service_type)
+        if builder is None:
+            return self._create_general_learning_prompt(previous_explanation, input_data, service_type)
+        return builder(self, previous_explanation, input_data)
+    
+    def _create_concept_learning_prompt(self, previous_explanation, input_data):
+        return _CONCEPT_LEARNING_PROMPT_TMPL.format(concept=input_data.get('concept', ''))
     
     def _create_tool_learning_prompt(self, previous_explanation, input_data):
-        return f"""
-        해당 AI 도구의 숙련도를 높이기 위한 학습 경로를 제안해주세요:
-        
-        1. 도구 숙련 로드맵
-           - 초보자부터 전문가까지의 학습 단계
-           - 단계별 기능 익히기 순서
-           - 숙련도 수준별 목표와 평가 방법
-        
-        2. 실습 중심 학습 계획
-           - 핵심 기능별 실습 과제
-           - 난이도별 프로젝트 아이디어
-           - 실전 시나리오 기반 연습
-        
-        3. 보완 학습 자원
-           - 공식 및 비공식 문서와 튜토리얼
-           - 커뮤니티 및 포럼 활용법
-           - 전문가 인사이트 및 고급 팁 확보 방법
-        
-        4. 지속적 역량 개발 전략
-           - 최신 기능 및 업데이트 학습법
-           - 관련 도구 및 확장 기술 습득
-           - 전문성 증명 및 인증 방법
-        
-        도구 이름:
-        {input_data.get('tool_name', '')}
-        
-        사용 목적:
-        {input_data.get('purpose', '')}
-        """
+        return _TOOL_LEARNING_PROMPT_TMPL.format(tool_name=input_data.get('tool_name', ''), purpose=input_data.get('purpose', ''))
     
     def _create_comprehensive_learning_prompt(self, previous_explanation, input_data):
-        return f"""
-        목표 달성을 위한 종합적인 AI 학습 로드맵을 제안해주세요:
-        
-        1. 개인화된 학습 경로
-           - 현재 수준에서 목표까지의 단계별 계획
-           - 학습자 특성에 맞는 접근법 및 방법론
-           - 단기/중기/장기 목표 설정 및 마일스톤
-        
-        2. 핵심 학습 자원 큐레이션
-           - 온라인 코스, 책, 튜토리얼 등 선별된 자원
-           - 품질과 적합성 기준의 자원 평가
-           - 비용 효율적인 학습 자원 활용 전략
-        
-        3. 실전 경험 구축 프레임워크
-           - 단계적 프로젝트 구성 계획
-           - 포트폴리오 구축 전략
-           - 실전 환경 시뮬레이션 및 연습 방법
-        
-        4. 지속적 피드백 및 개선 시스템
-           - 진행 상황 모니터링 및 평가 방법
-           - 멘토십 및 코칭 활용 전략
-           - 학습 습관 및 효율성 개선 방법
-        
-        5. 학습 여정 시간표
-           - 주간/월간/분기별 학습 일정 제안
-           - 시간 관리 및 학습 균형 전략
-           - 장애물 극복 및 동기 유지 방법
-        
-        현재 지식 수준:
-        {input_data.get('current_level', '')}
-        
-        학습 목표:
-        {input_data.get('goals', '')}
-        """
+        return _COMPREHENSIVE_LEARNING_PROMPT_TMPL.format(current_level=input_data.get('current_level', ''), goals=input_data.get('goals', ''))
     
     def _create_ethics_learning_prompt(self, previous_explanation, input_data):
-        return f"""
-        AI 윤리 및 안전에 대한 체계적인 학습 경로를 제안해주세요:
-        
-        1. 윤리적 AI 역량 개발 로드맵
-           - 기초부터 고급까지의 학습 단계
-           - 역할별 필요 지식과 역량(개발자/관리자/정책입안자)
-           - 윤리적 사고방식과 평가 능력 개발
-        
-        2. 추천 학습 자원
-           - 교재, 온라인 코스, 케이스 스터디
-           - 윤리적 프레임워크 및 도구
-           - 인증 및 전문가 과정
-        
-        3. 실습 및 토론 기반 학습
-           - 윤리적 딜레마 시나리오 분석
-           - 그룹 토론 및 사례 연구 방법
-           - 윤리적 감사 및 평가 실습
-        
-        4. 지속적인 역량 발전 계획
-           - 윤리적 AI 분야 최신 동향 파악 방법
-           - 전문가 커뮤니티 및 컨퍼런스 참여
-           - 자기 평가 및 성찰 방법론
-        
-        관심 분야:
-        {input_data.get('area_of_interest', '')}
-        """
+        return _ETHICS_LEARNING_PROMPT_TMPL.format(area_of_interest=input_data.get('area_of_interest', ''))
     
     def _create_cs_spec_learning_prompt(self, previous_explanation, input_data):
-        return f"""
-        CS 학생을 위한 맞춤형 스펙 구축 학습 경로를 제안해주세요:
-        
-        현재 상황:
-        {input_data.get('current_situation', '')}
-        
-        목표:
-        {input_data.get('career_goals', '')}
-        
-        다음 구조로 구체적인 학습 경로를 제안해주세요:
-        
-        1. 단계별 스펙 구축 로드맵
-           - 1단계 (1-3개월): 기초 기술 스택 완성
-           - 2단계 (3-6개월): 프로젝트 경험 쌓기
-           - 3단계 (6-12개월): 전문 분야 심화
-           - 4단계 (12개월+): 포트폴리오 완성 및 취업 준비
-        
-        2. 학년별 구체적인 학습 계획
-           - 1학년: 프로그래밍 기초, 수학 기초, 컴퓨터 구조
-           - 2학년: 자료구조/알고리즘, 웹 개발 기초, 데이터베이스
-           - 3학년: 프레임워크 숙련, 클라우드 기초, 인턴십 준비
-           - 4학년: 전문 분야 심화, 포트폴리오 완성, 취업 준비
-        
-        3. 추천 학습 자원과 도구
-           - 온라인 강의: Coursera, edX, Udemy, 인프런
-           - 책: 각 분야별 필수 서적과 참고서
-           - 실습 환경: GitHub, AWS Free Tier, Docker
-           - 커뮤니티: Stack Overflow, Reddit, 기술 블로그
-        
-        4. 프로젝트 포트폴리오 구축 전략
-           - 개인 프로젝트: 3-5개의 완성된 프로젝트
-           - 오픈소스 기여: GitHub 활동, 기여도 증명
-           - 기술 블로그: 학습 과정과 프로젝트 기록
-           - 대회 참여: 해커톤, 알고리즘 대회, 해커랭크
-        
-        5. GPA 관리 및 학업 전략
-           - 전공 과목 우선순위와 학습 방법
-           - 수학 과목의 중요성과 학습 전략
-           - 프로젝트와 학업의 균형 맞추기
-           - 각 학년별 목표 GPA 설정
-        
-        6. 취업 준비 체크리스트
-           - 이력서 작성: 기술 스택, 프로젝트 경험
-           - 포트폴리오 사이트: GitHub Pages, 개인 웹사이트
-           - 코딩 테스트 준비: LeetCode, 프로그래머스
-           - 면접 준비: 기술 면접, 시스템 설계, 행동 면접
-        
-        7. 네트워킹과 커리어 개발
-           - 기술 컨퍼런스 참여: PyCon, JSConf, AWS Summit
-           - 멘토링: 선배, 교수, 업계 전문가
-           - 인턴십 신청: 대기업, 스타트업, 중견기업
-           - 자격증 취득: AWS, Google Cloud, 정보처리기사
-        """
+        return _CS_SPEC_LEARNING_PROMPT_TMPL.format(current_situation=input_data.get('current_situation', ''), career_goals=input_data.get('career_goals', ''))
     
     def _create_general_learning_prompt(self, previous_explanation, input_data, service_type):
-        return f"""
-        다음 {service_type} 요청에 대해 학습 경로 관점에서 맞춤형 계획을 제안해주세요:
-        
-        요청 내용:
-        {str(input_data)}
-        
-        체계적인 학습 단계, 추천 자원, 실습 계획, 진행 평가 방법을 구체적으로 제시해주세요.
-        """
+        return _GENERAL_LEARNING_PROMPT_TMPL.format(service_type=service_type, request=_fmt(input_data))
+    
+    # 서비스 유형별 프롬프트 생성 메서드
+    PROMPT_BUILDERS = {
+        "AI 개념 이해": _create_concept_learning_prompt,
+        "AI 도구 사용법": _create_tool_learning_prompt,
+        "AI 학습 계획": _create_comprehensive_learning_prompt,
+        "AI 윤리 및 안전": _create_ethics_learning_prompt,
+        "CS 학생 스펙 가이드": _create_cs_spec_learning_prompt,
+    }
 
 
 # ============================================================================
 # Streamlit 웹 애플리케이션 구현
 # ============================================================================
 
+# 화면에 표시하는 고정 텍스트와 스타일 (main()에서는 조건 분기 없이 조회만 수행)
+_HEADER_MD = """
+### 3명의 전문 교육가가 협업하여 맞춤형 AI 학습 가이드를 제공합니다
+
+* **김민준 기초 전문가**: 핵심 개념과 이론적 배경 설명
+* **박서연 실무 전문가**: 실제 응용 사례와 현업 통찰력 제공
+* **이준호 학습 경로 전문가**: 맞춤형 학습 계획과 자원 추천
+"""
+
+_EXPERT_BIOS = {
+    "김민준 기초 전문가": """
+**김민준 기초 전문가**
+
+AI 기초 개념 전문가로 12년간 인공지능 연구와 교육을 담당했습니다.
+복잡한 AI 개념을 명확하고 이해하기 쉽게 설명합니다.
+
+* 전문 분야: 머신러닝 이론, 딥러닝 아키텍처, 알고리즘 원리
+* 경력: 국내 주요 AI 연구소, 글로벌 테크 기업 AI 교육 담당
+* 학력: 컴퓨터과학 박사, AI 및 머신러닝 전공
+""",
+    "박서연 실무 전문가": """
+**박서연 실무 전문가**
+
+AI 실무 응용 전문가로 10년간 AI 프로젝트 구현 및 컨설팅을 담당했습니다.
+이론을 실제 비즈니스 환경에서 어떻게 활용하는지 안내합니다.
+
+* 전문 분야: AI 비즈니스 적용, 산업별 활용 사례, 프로젝트 구현
+* 경력: 스타트업 CTO, 대기업 AI 솔루션 아키텍트, 독립 AI 컨설턴트
+* 학력: 컴퓨터공학 학사, AI 및 데이터 사이언스 석사
+""",
+    "이준호 학습 경로 전문가": """
+**이준호 학습 경로 전문가**
+
+AI 학습 계획 전문가로 15년간 맞춤형 교육과 커리큘럼 설계를 담당했습니다.
+개인의 목표와 수준에 맞는 최적의 학습 경로를 제안합니다.
+
+* 전문 분야: 학습 경로 설계, 교육 자원 큐레이션, 학습 방법론
+* 경력: 교육 플랫폼 디렉터, AI 교육 컨설턴트, 대학 교수
+* 학력: 교육학 박사, 인지과학 및 학습 설계 전공
+""",
+}
+
+# 서비스별 화면 구성 (입력 항목, 예시, 버튼 문구 등). 선택 목록의 순서도 이 정의를 따름
+_SERVICES = {
+    "AI 개념 이해": {
+        "subheader": "🧩 AI 개념 이해",
+        "description": "AI의 기본 개념과 원리를 쉽게 이해하고 싶을 때",
+        "examples_label": "💡 예시 보기",
+        "examples_md": """
+**추천 입력 예시:**
+- 머신러닝이 무엇인지 알고 싶어요
+- 딥러닝과 머신러닝의 차이점은 무엇인가요?
+- 자연어 처리는 어떻게 작동하나요?
+- 컴퓨터 비전의 기본 원리는 무엇인가요?
+""",
+        "fields": [
+            {
+                "key": "concept",
+                "label": "이해하고 싶은 AI 개념을 입력하세요",
+                "height": 150,
+                "placeholder": "예: 머신러닝이 무엇인지 알고 싶어요",
+                "help": "구체적으로 궁금한 AI 개념이나 질문을 입력해주세요",
+            },
+        ],
+        "button": "🚀 학습 가이드 생성",
+        "warning": "AI 개념을 입력해주세요.",
+        "header": _RESULT_HEADER,
+    },
+    "AI 도구 사용법": {
+        "subheader": "🛠️ AI 도구 사용법",
+        "description": "특정 AI 도구를 효과적으로 활용하는 방법을 배우고 싶을 때",
+        "examples_label": "💡 예시 보기",
+        "examples_md": """
+**추천 입력 예시:**
+- **도구 이름**: ChatGPT, Claude, Midjourney, Stable Diffusion
+- **사용 목적**: 콘텐츠 작성, 이미지 생성, 코드 작성, 데이터 분석
+""",
+        "fields": [
+            {
+                "key": "tool_name",
+                "label": "학습하려는 AI 도구 이름을 입력하세요",
+                "height": 100,
+                "placeholder": "예: ChatGPT",
+                "help": "구체적인 AI 도구 이름을 입력해주세요",
+            },
+            {
+                "key": "purpose",
+                "label": "사용 목적을 입력하세요",
+                "height": 100,
+                "placeholder": "예: 콘텐츠 작성",
+                "help": "해당 도구를 어떤 목적으로 사용하고 싶은지 입력해주세요",
+            },
+        ],
+        "button": "🚀 학습 가이드 생성",
+        "warning": "도구 이름과 사용 목적을 모두 입력해주세요.",
+        "header": _RESULT_HEADER,
+    },
+    "AI 학습 계획": {
+        "subheader": "📈 AI 학습 계획",
+        "description": "체계적인 AI 학습 로드맵과 계획이 필요할 때",
+        "examples_label": "💡 예시 보기",
+        "examples_md": """
+**현재 수준 예시:**
+- AI 초보자입니다. 프로그래밍 경험은 있지만 AI는 처음입니다.
+- 머신러닝 기초는 알고 있지만 딥러닝은 모릅니다.
+- 데이터 사이언스 경험이 있지만 AI 모델 구축은 처음입니다.
+
+**학습 목표 예시:**
+- 6개월 내에 AI 엔지니어로 취업하고 싶습니다.
+- 현재 업무에 AI를 적용할 수 있는 수준이 되고 싶습니다.
+- AI 연구자로 전환하고 싶습니다.
+""",
+        "fields": [
+            {
+                "key": "current_level",
+                "label": "현재 AI 지식 수준을 입력하세요",
+                "height": 150,
+                "placeholder": "예: AI 초보자입니다. 프로그래밍 경험은 있지만 AI는 처음입니다.",
+                "help": "현재 AI에 대한 지식 수준을 구체적으로 설명해주세요",
+            },
+            {
+                "key": "goals",
+                "label": "학습 목표를 입력하세요",
+                "height": 150,
+                "placeholder": "예: 6개월 내에 AI 엔지니어로 취업하고 싶습니다.",
+                "help": "구체적인 학습 목표와 기간을 입력해주세요",
+            },
+        ],
+        "button": "🚀 학습 계획 생성",
+        "warning": "현재 지식 수준과 학습 목표를 모두 입력해주세요.",
+        "header": _RESULT_HEADER,
+    },
+    "CS 학생 스펙 가이드": {
+        "subheader": "CS 학생 스펙 가이드",
+        "description": "컴퓨터공학 전공 학생을 위한 구체적인 스펙 로드맵이 필요할 때",
+        "examples_label": "예시 보기",
+        "examples_md": """
+**현재 상황 예시:**
+- 2학년 CS 전공, Python 기초만 알고 있음
+- 3학년 CS 전공, 웹 개발 경험 있음, 취업 준비 중
+- 4학년 CS 전공, AI/ML 관심 있음, 대기업 목표
+
+**목표 예시:**
+- 3학년까지 웹 개발 전문가가 되고 싶음
+- 졸업 후 구글, 마이크로소프트 같은 빅테크 입사
+- AI/ML 엔지니어로 취업하고 싶음
+- 스타트업에서 풀스택 개발자로 일하고 싶음
+""",
+        "fields": [
+            {
+                "key": "current_situation",
+                "label": "현재 상황을 입력하세요",
+                "height": 150,
+                "placeholder": "예: 2학년 CS 전공, Python 기초만 알고 있음",
+                "help": "현재 학년, 전공, 보유 기술, 경험 등을 구체적으로 입력해주세요",
+            },
+            {
+                "key": "career_goals",
+                "label": "목표를 입력하세요",
+                "height": 150,
+                "placeholder": "예: 3학년까지 웹 개발 전문가가 되고 싶음",
+                "help": "구체적인 취업 목표나 기술 목표를 입력해주세요",
+            },
+        ],
+        "button": "스펙 가이드 생성",
+        "warning": "현재 상황과 목표를 모두 입력해주세요.",
+        "header": "### 전문가 팀 스펙 가이드",
+    },
+    "AI 윤리 및 안전": {
+        "subheader": "🛡️ AI 윤리 및 안전",
+        "description": "AI의 윤리적 사용과 안전한 활용에 대해 알고 싶을 때",
+        "examples_label": "💡 예시 보기",
+        "examples_md": """
+**추천 입력 예시:**
+- AI 편향성과 공정성에 대해 알고 싶습니다.
+- AI의 투명성과 설명 가능성에 관심이 있습니다.
+- AI 개발 시 고려해야 할 윤리적 원칙들을 배우고 싶습니다.
+- AI 안전성과 위험 관리에 대해 알고 싶습니다.
+- AI 규제와 정책에 대해 학습하고 싶습니다.
+""",
+        "fields": [
+            {
+                "key": "area_of_interest",
+                "label": "관심 있는 AI 윤리/안전 영역을 입력하세요",
+                "height": 150,
+                "placeholder": "예: AI 편향성과 공정성에 대해 알고 싶습니다.",
+                "help": "구체적으로 관심 있는 AI 윤리나 안전 관련 주제를 입력해주세요",
+            },
+        ],
+        "button": "🚀 학습 가이드 생성",
+        "warning": "관심 있는 AI 윤리/안전 영역을 입력해주세요.",
+        "header": _RESULT_HEADER,
+    },
+}
+
+_WORKFLOW_MD = """
+### 에이전틱 워크플로우 프로세스
+
+1. **요청 분석**: 사용자 요청을 분석하여 필요한 전문성 식별
+2. **팀 구성**: 각 요청에 최적화된 AI 전문가 팀 구성
+3. **개념 설명**: AI 기초 전문가가 핵심 개념과 이론적 배경 설명
+4. **실무 응용**: 실무 전문가가 실제 적용 사례와 업계 통찰력 제공
+5. **학습 계획**: 학습 경로 전문가가 맞춤형 학습 계획과 자원 추천
+6. **통합 가이드**: 세 전문가의 관점을 통합한 최종 맞춤형 학습 가이드 제공
+
+각 전문가는 독립적인 전문성을 가지고 있으며, 동시 분석과 최종 통합을 통해 종합적인 관점을 제공합니다.
+"""
+
+# 카드 스타일 CSS
+_CSS = """
+<style>
+.expert-card {
+    border-radius: 10px;
+    padding: 20px;
+    margin-bottom: 20px;
+}
+.foundations-expert {
+    background-color: #E8F4F9;
+    border-left: 5px solid #0077B6;
+}
+.practical-expert {
+    background-color: #E8F9E9;
+    border-left: 5px solid #2D6A4F;
+}
+.learning-expert {
+    background-color: #F9F3E8;
+    border-left: 5px solid #D4A017;
+}
+</style>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _get_team(api_key):
+    """
+    API 키별로 AI 교육 팀을 한 번만 생성하여 재실행과 세션 사이에서 공유
+    (키 검증에 실패하면 예외가 발생하므로 캐시되지 않음)
+    Args:
+        api_key (str): Google AI API 키
+    Returns:
+        AIEducationTeam: 공유 교육 팀
+    """
+    team = AIEducationTeam(api_key)
+    team.warm_up()
+    return team
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _run_education(api_key, service_type, input_items):
+    """
+    빠른 모드(단일 요청)의 결과를 API 키·서비스·입력별로 1시간 동안 저장
+    오류는 예외로 전달되므로 성공한 결과만 저장되며, 스트리밍하는 기본 모드에는 사용하지 않음
+    Args:
+        api_key (str): Google AI API 키 (사용자 간 결과가 섞이지 않도록 캐시 키에 포함)
+        service_type (str): 요청 서비스 유형
+        input_items (tuple): 정렬된 (키, 값) 쌍으로 변환한 사용자 입력 데이터
+    Returns:
+        str: 최종 교육 지원 결과
+    """
+    return _get_team(api_key)._generate_batched(service_type, dict(input_items))
+
+
+@st.fragment
+def _render_expert_bios():
+    """
+    사이드바의 전문가 소개 (선택을 바꿔도 이 영역만 다시 실행되어 생성된 가이드가 유지됨)
+    """
+    st.markdown("### 🧠 전문가 소개")
+    
+    expert_tab = st.selectbox("전문가 정보 보기", list(_EXPERT_BIOS))
+    
+    st.markdown(_EXPERT_BIOS[expert_tab])
+
+
+def _render_workflow_log(education_team):
+    """
+    마지막 요청의 워크플로우 로그 표시 (개발자 모드에서만 표시)
+    Args:
+        education_team (AIEducationTeam): 현재 전문가 팀
+    """
+    if st.session_state.show_full_log and education_team.workflow_logs:
+        with st.expander("🔍 워크플로우 로그 보기 (개발자 모드)"):
+            st.json(education_team.workflow_logs[-1])
+
+
+@st.fragment
+def _render_service(service, batched_mode, parallel=True):
+    """
+    서비스 설정(_SERVICES)에 따라 입력 폼을 표시하고, 제출되면 전문가 팀의 학습 가이드를 표시
+    폼 제출 시에는 이 영역만 다시 실행하고, 생성이 끝나면 결과를 세션에 저장한 뒤 앱 전체를 다시 실행하여 사이드바 통계를 갱신
+    (오류가 발생한 경우에는 안내 메시지가 사라지지 않도록 저장과 다시 실행을 건너뜀)
+    Args:
+        service (str): 선택된 서비스 유형
+        batched_mode (bool): 빠른 모드(단일 요청) 사용 여부
+        parallel (bool): 기초·실무 분석을 동시에 실행할지 여부 (빠른 모드에서는 사용하지 않음)
+    """
+    config = _SERVICES[service]
+    st.subheader(config["subheader"])
+    
+    # 예시 제공
+    with st.expander(config["examples_label"]):
+        st.markdown(config["examples_md"])
+    
+    # 입력 위젯을 폼으로 묶어 입력 중에는 다시 실행하지 않고 제출할 때만 실행
+    with st.form(key=f"form_{service}", clear_on_submit=False):
+        # 입력 항목이 여러 개이면 컬럼으로 화면 분할
+        fields = config["fields"]
+        areas = st.columns(len(fields)) if len(fields) > 1 else [st.container()]
+        values = {}
+        for area, field in zip(areas, fields):
+            with area:
+                values[field["key"]] = st.text_area(
+                    field["label"],
+                    height=field["height"],
+                    placeholder=field["placeholder"],
+                    help=field["help"]
+                )
+        
+        # 분석 시작 버튼
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            submitted = st.form_submit_button(config["button"], type="primary", use_container_width=True)
+    
+    # 전문가 팀 사용
+    education_team = st.session_state.current_team
+    
+    if submitted:
+        # 입력 데이터 구성
+        input_data = {key: value.strip() for key, value in values.items()}
+        if not all(input_data.values()):
+            st.warning(config["warning"])
+            return
+        
+        # 요청 전 마지막 워크플로우 로그 (세션에 저장된 결과로 응답하면 로그가 추가되지 않음)
+        logs = education_team.workflow_logs
+        previous_log = logs[-1] if logs else None
+        
+        # 결과 처리 (기본 모드는 최종 가이드를 생성되는 대로 표시)
+        drafts = None
+        if batched_mode:
+            result = education_team.get_ai_education_batched(service, input_data)
+        else:
+            # 진행 상황과 결과 제목은 위쪽 영역에, 생성되는 가이드는 그 아래 테두리 컨테이너에 표시
+            progress_area = st.container()
+            result_box = st.container(border=True)
+            with progress_area:
+                result = result_box.write_stream(education_team.get_ai_education_stream(
+                    service, input_data, header=config["header"], parallel=parallel
+                ))
+            drafts = education_team.get_draft_explanations(service, input_data, parallel)
+        
+        # 이번 요청이 실패했으면 오류 안내와 로그를 그대로 두고 종료
+        if logs and logs[-1] is not previous_log and logs[-1]["status"] == "error":
+            _render_workflow_log(education_team)
+            return
+        
+        # 결과를 저장하고 앱 전체를 다시 실행 (프래그먼트 밖의 사이드바 통계와 로그 초기화 버튼 갱신)
+        st.session_state.last_result = {"service": service, "guide": result, "drafts": drafts}
+        st.rerun(scope="app")
+    
+    # 마지막 결과 표시 (다른 서비스를 선택한 경우에는 표시하지 않음)
+    last_result = st.session_state.get("last_result")
+    if not last_result or last_result["service"] != service:
+        return
+    
+    # 1·2단계 전문가의 분석 원문은 최종 가이드 위에 접어서 표시
+    drafts = last_result["drafts"]
+    if drafts:
+        foundations_col, practical_col = st.columns(2)
+        with foundations_col.expander("🧠 김민준 기초 전문가의 분석"):
+            st.markdown(drafts["foundations"])
+        with practical_col.expander("💼 박서연 실무 전문가의 분석"):
+            st.markdown(drafts["practical"])
+    
+    # 최종 가이드는 테두리 컨테이너에 일반 마크다운으로 표시 (HTML 래핑 없이)
+    st.markdown(config["header"])
+    with st.container(border=True):
+        st.markdown(last_result["guide"])
+    
+    _render_workflow_log(education_team)
+
+
 def main():
     """
     메인 함수: Streamlit 웹 애플리케이션의 메인 로직
@@ -801,20 +1911,15 @@ def main():
     )
     
     # 세션 상태 초기화
-    if 'workflow_logs' not in st.session_state:
-        st.session_state.workflow_logs = []
+    if 'total_requests' not in st.session_state:
+        st.session_state.total_requests = 0
+        st.session_state.successful_requests = 0
     if 'current_team' not in st.session_state:
         st.session_state.current_team = None
     
     # 페이지 제목 및 설명
     st.title("🧠 AI 교육 전문가 팀")
-    st.markdown("""
-    ### 3명의 전문 교육가가 협업하여 맞춤형 AI 학습 가이드를 제공합니다
-    
-    * **김민준 기초 전문가**: 핵심 개념과 이론적 배경 설명
-    * **박서연 실무 전문가**: 실제 응용 사례와 현업 통찰력 제공
-    * **이준호 학습 경로 전문가**: 맞춤형 학습 계획과 자원 추천
-    """)
+    st.markdown(_HEADER_MD)
     st.markdown("---")
     
     # 사이드바 설정
@@ -831,71 +1936,49 @@ def main():
         
         # API 키 유효성 검사
         try:
-            if st.session_state.current_team is None or st.session_state.current_team.api_key != api_key:
-                st.session_state.current_team = AIEducationTeam(api_key)
+            team = _get_team(api_key)
+            if st.session_state.current_team is not team:
+                st.session_state.current_team = team
                 st.success("✅ API 키가 유효합니다!")
-        except Exception as e:
+        except ValueError as e:
             st.error(f"❌ API 키 오류: {str(e)}")
             st.stop()
+        except Exception as e:
+            # 일시적인 오류는 캐시되지 않으므로 다시 시도하면 키를 다시 확인
+            st.error(f"❌ 연결 오류: {str(e)}")
+            st.info("💡 잠시 후 다시 시도해주세요.")
+            st.stop()
+        
+        # 빠른 모드: 세 전문가의 분석을 한 번의 AI 호출로 처리
+        batched_mode = st.toggle("⚡ 빠른 모드 (단일 요청)", help="세 전문가의 분석을 한 번의 AI 호출로 묶어 응답 시간을 줄입니다")
+        # 순차 검토 모드: 실무 전문가가 기초 전문가의 설명을 검토한 뒤 보완 (동시 분석보다 느림)
+        sequential_mode = st.toggle(
+            "🔗 순차 검토 모드",
+            disabled=batched_mode,
+            help="실무 응용 전문가가 기초 전문가의 설명 전체를 검토한 뒤 보완합니다 (동시 분석보다 시간이 더 걸립니다)"
+        )
+        # 개발자 모드: 결과 아래에 해당 요청의 워크플로우 로그 표시
+        st.toggle("🛠️ 개발자 모드", key="show_full_log", help="학습 가이드 아래에 워크플로우 로그를 함께 표시합니다")
             
         st.markdown("---")
         
-        # 워크플로우 통계
-        if st.session_state.workflow_logs:
+        # 워크플로우 통계 (요청을 기록할 때 누적한 카운터를 그대로 표시)
+        if st.session_state.total_requests:
             st.markdown("### 📊 워크플로우 통계")
-            total_requests = len(st.session_state.workflow_logs)
-            successful_requests = len([log for log in st.session_state.workflow_logs if log.get('status') == 'completed'])
-            st.metric("총 요청 수", total_requests)
-            st.metric("성공한 요청", successful_requests)
+            st.metric("총 요청 수", st.session_state.total_requests)
+            st.metric("성공한 요청", st.session_state.successful_requests)
             
             if st.button("🗑️ 로그 초기화"):
-                st.session_state.workflow_logs = []
+                st.session_state.pop("workflow_logs", None)
+                st.session_state.total_requests = 0
+                st.session_state.successful_requests = 0
                 st.rerun()
             
             st.markdown("---")
         
         # 전문가 소개
-        st.markdown("### 🧠 전문가 소개")
-        
-        expert_tab = st.selectbox("전문가 정보 보기", 
-                                ["김민준 기초 전문가", "박서연 실무 전문가", "이준호 학습 경로 전문가"])
-        
-        if expert_tab == "김민준 기초 전문가":
-            st.markdown("""
-            **김민준 기초 전문가**
-            
-            AI 기초 개념 전문가로 12년간 인공지능 연구와 교육을 담당했습니다.
-            복잡한 AI 개념을 명확하고 이해하기 쉽게 설명합니다.
-            
-            * 전문 분야: 머신러닝 이론, 딥러닝 아키텍처, 알고리즘 원리
-            * 경력: 국내 주요 AI 연구소, 글로벌 테크 기업 AI 교육 담당
-            * 학력: 컴퓨터과학 박사, AI 및 머신러닝 전공
-            """)
-        
-        elif expert_tab == "박서연 실무 전문가":
-            st.markdown("""
-            **박서연 실무 전문가**
-            
-            AI 실무 응용 전문가로 10년간 AI 프로젝트 구현 및 컨설팅을 담당했습니다.
-            이론을 실제 비즈니스 환경에서 어떻게 활용하는지 안내합니다.
-            
-            * 전문 분야: AI 비즈니스 적용, 산업별 활용 사례, 프로젝트 구현
-            * 경력: 스타트업 CTO, 대기업 AI 솔루션 아키텍트, 독립 AI 컨설턴트
-            * 학력: 컴퓨터공학 학사, AI 및 데이터 사이언스 석사
-            """)
+        _render_expert_bios()
         
-        elif expert_tab == "이준호 학습 경로 전문가":
-            st.markdown("""
-            **이준호 학습 경로 전문가**
-            
-            AI 학습 계획 전문가로 15년간 맞춤형 교육과 커리큘럼 설계를 담당했습니다.
-            개인의 목표와 수준에 맞는 최적의 학습 경로를 제안합니다.
-            
-            * 전문 분야: 학습 경로 설계, 교육 자원 큐레이션, 학습 방법론
-            * 경력: 교육 플랫폼 디렉터, AI 교육 컨설턴트, 대학 교수
-            * 학력: 교육학 박사, 인지과학 및 학습 설계 전공
-            """)
-            
         st.markdown("---")
         # 사용 방법 안내
         st.markdown("### ℹ️ 사용 방법")
@@ -903,7 +1986,7 @@ def main():
         1. API 키를 입력하세요
         2. 원하는 서비스를 선택하세요
         3. 필요한 정보를 입력하세요
-        4. '학습 가이드 생성' 버튼을 클릭하면 3명의 전문가가 순차적으로 분석합니다
+        4. '학습 가이드 생성' 버튼을 클릭하면 3명의 전문가가 협력하여 분석합니다
         5. 최종 학습 가이드를 확인하세요
         """)
     
@@ -911,343 +1994,23 @@ def main():
     st.markdown("### 🎯 서비스 선택")
     service = st.selectbox(
         "원하는 서비스를 선택하세요",
-        ["AI 개념 이해", "AI 도구 사용법", "AI 학습 계획", "CS 학생 스펙 가이드", "AI 윤리 및 안전"],
+        list(_SERVICES),
         help="각 서비스는 3명의 전문가가 협력하여 맞춤형 가이드를 제공합니다"
     )
     
     # 서비스 설명
-    service_descriptions = {
-        "AI 개념 이해": "AI의 기본 개념과 원리를 쉽게 이해하고 싶을 때",
-        "AI 도구 사용법": "특정 AI 도구를 효과적으로 활용하는 방법을 배우고 싶을 때",
-        "AI 학습 계획": "체계적인 AI 학습 로드맵과 계획이 필요할 때",
-        "CS 학생 스펙 가이드": "컴퓨터공학 전공 학생을 위한 구체적인 스펙 로드맵이 필요할 때",
-        "AI 윤리 및 안전": "AI의 윤리적 사용과 안전한 활용에 대해 알고 싶을 때"
-    }
-    
-    st.info(service_descriptions[service])
+    st.info(_SERVICES[service]["description"])
     st.markdown("---")
     
-    # 카드 스타일 CSS
-    st.markdown("""
-    <style>
-    .expert-card {
-        border-radius: 10px;
-        padding: 20px;
-        margin-bottom: 20px;
-    }
-    .foundations-expert {
-        background-color: #E8F4F9;
-        border-left: 5px solid #0077B6;
-    }
-    .practical-expert {
-        background-color: #E8F9E9;
-        border-left: 5px solid #2D6A4F;
-    }
-    .learning-expert {
-        background-color: #F9F3E8;
-        border-left: 5px solid #D4A017;
-    }
-    .final-guidance {
-        background-color: #F2F2F2;
-        border: 2px solid #555555;
-        border-radius: 10px;
-        padding: 25px;
-        margin-top: 30px;
-        color: #222;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # 카드 스타일 CSS (Streamlit은 다시 실행될 때 출력되지 않은 요소를 제거하므로 매번 출력)
+    st.markdown(_CSS, unsafe_allow_html=True)
     
     # 워크플로우 설명
     with st.expander("에이전틱 워크플로우 프로세스 보기"):
-        st.markdown("""
-        ### 에이전틱 워크플로우 프로세스
-        
-        1. **요청 분석**: 사용자 요청을 분석하여 필요한 전문성 식별
-        2. **팀 구성**: 각 요청에 최적화된 AI 전문가 팀 구성
-        3. **개념 설명**: AI 기초 전문가가 핵심 개념과 이론적 배경 설명
-        4. **실무 응용**: 실무 전문가가 실제 적용 사례와 업계 통찰력 제공
-        5. **학습 계획**: 학습 경로 전문가가 맞춤형 학습 계획과 자원 추천
-        6. **통합 가이드**: 세 전문가의 관점을 통합한 최종 맞춤형 학습 가이드 제공
-        
-        각 전문가는 독립적인 전문성을 가지고 있으며, 순차적 협업을 통해 종합적인 관점을 제공합니다.
-        """)
+        st.markdown(_WORKFLOW_MD)
     
     # 선택된 서비스에 따른 UI 표시
-    if service == "AI 개념 이해":
-        st.subheader("🧩 AI 개념 이해")
-        
-        # 예시 제공
-        with st.expander("💡 예시 보기"):
-            st.markdown("""
-            **추천 입력 예시:**
-            - 머신러닝이 무엇인지 알고 싶어요
-            - 딥러닝과 머신러닝의 차이점은 무엇인가요?
-            - 자연어 처리는 어떻게 작동하나요?
-            - 컴퓨터 비전의 기본 원리는 무엇인가요?
-            """)
-        
-        # 개념 입력 텍스트 영역
-        concept = st.text_area(
-            "이해하고 싶은 AI 개념을 입력하세요", 
-            height=150,
-            placeholder="예: 머신러닝이 무엇인지 알고 싶어요",
-            help="구체적으로 궁금한 AI 개념이나 질문을 입력해주세요"
-        )
-        
-        # 분석 시작 버튼
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🚀 학습 가이드 생성", type="primary", use_container_width=True):
-                if concept.strip():
-                    # 전문가 팀 사용
-                    education_team = st.session_state.current_team
-                    
-                    # 입력 데이터 구성
-                    input_data = {"concept": concept.strip()}
-                    
-                    # 결과 처리
-                    result = education_team.get_ai_education("AI 개념 이해", input_data)
-                    
-                    # 워크플로우 로그 저장
-                    st.session_state.workflow_logs.extend(education_team.workflow_logs)
-                    
-                    # 결과 표시
-                    st.markdown("### 📊 전문가 팀 학습 가이드")
-                    st.markdown(f"""<div class="final-guidance">{result}</div>""", unsafe_allow_html=True)
-                    
-                    # 워크플로우 로그 (개발자 모드)
-                    with st.expander("🔍 워크플로우 로그 보기 (개발자 모드)"):
-                        st.json(education_team.workflow_logs[-1])
-                else:
-                    st.warning("AI 개념을 입력해주세요.")
-                
-    elif service == "AI 도구 사용법":
-        st.subheader("🛠️ AI 도구 사용법")
-        
-        # 예시 제공
-        with st.expander("💡 예시 보기"):
-            st.markdown("""
-            **추천 입력 예시:**
-            - **도구 이름**: ChatGPT, Claude, Midjourney, Stable Diffusion
-            - **사용 목적**: 콘텐츠 작성, 이미지 생성, 코드 작성, 데이터 분석
-            """)
-        
-        # 두 개의 컬럼으로 화면 분할
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            tool_name = st.text_area(
-                "학습하려는 AI 도구 이름을 입력하세요", 
-                height=100,
-                placeholder="예: ChatGPT",
-                help="구체적인 AI 도구 이름을 입력해주세요"
-            )
-        with col2:
-            purpose = st.text_area(
-                "사용 목적을 입력하세요", 
-                height=100,
-                placeholder="예: 콘텐츠 작성",
-                help="해당 도구를 어떤 목적으로 사용하고 싶은지 입력해주세요"
-            )
-        
-        # 분석 시작 버튼
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🚀 학습 가이드 생성", type="primary", use_container_width=True):
-                if tool_name.strip() and purpose.strip():
-                    # 전문가 팀 사용
-                    education_team = st.session_state.current_team
-                    
-                    # 입력 데이터 구성
-                    input_data = {"tool_name": tool_name.strip(), "purpose": purpose.strip()}
-                    
-                    # 결과 처리
-                    result = education_team.get_ai_education("AI 도구 사용법", input_data)
-                    
-                    # 워크플로우 로그 저장
-                    st.session_state.workflow_logs.extend(education_team.workflow_logs)
-                    
-                    # 결과 표시
-                    st.markdown("### 📊 전문가 팀 학습 가이드")
-                    st.markdown(f"""<div class="final-guidance">{result}</div>""", unsafe_allow_html=True)
-                    
-                    # 워크플로우 로그 (개발자 모드)
-                    with st.expander("🔍 워크플로우 로그 보기 (개발자 모드)"):
-                        st.json(education_team.workflow_logs[-1])
-                else:
-                    st.warning("도구 이름과 사용 목적을 모두 입력해주세요.")
-                
-    elif service == "AI 학습 계획":
-        st.subheader("📈 AI 학습 계획")
-        
-        # 예시 제공
-        with st.expander("💡 예시 보기"):
-            st.markdown("""
-            **현재 수준 예시:**
-            - AI 초보자입니다. 프로그래밍 경험은 있지만 AI는 처음입니다.
-            - 머신러닝 기초는 알고 있지만 딥러닝은 모릅니다.
-            - 데이터 사이언스 경험이 있지만 AI 모델 구축은 처음입니다.
-            
-            **학습 목표 예시:**
-            - 6개월 내에 AI 엔지니어로 취업하고 싶습니다.
-            - 현재 업무에 AI를 적용할 수 있는 수준이 되고 싶습니다.
-            - AI 연구자로 전환하고 싶습니다.
-            """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            current_level = st.text_area(
-                "현재 AI 지식 수준을 입력하세요", 
-                height=150,
-                placeholder="예: AI 초보자입니다. 프로그래밍 경험은 있지만 AI는 처음입니다.",
-                help="현재 AI에 대한 지식 수준을 구체적으로 설명해주세요"
-            )
-        with col2:
-            goals = st.text_area(
-                "학습 목표를 입력하세요", 
-                height=150,
-                placeholder="예: 6개월 내에 AI 엔지니어로 취업하고 싶습니다.",
-                help="구체적인 학습 목표와 기간을 입력해주세요"
-            )
-        
-        # 분석 시작 버튼
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🚀 학습 계획 생성", type="primary", use_container_width=True):
-                if current_level.strip() and goals.strip():
-                    # 전문가 팀 사용
-                    education_team = st.session_state.current_team
-                    
-                    # 입력 데이터 구성
-                    input_data = {"current_level": current_level.strip(), "goals": goals.strip()}
-                    
-                    # 결과 처리
-                    result = education_team.get_ai_education("AI 학습 계획", input_data)
-                    
-                    # 워크플로우 로그 저장
-                    st.session_state.workflow_logs.extend(education_team.workflow_logs)
-                    
-                    # 결과 표시
-                    st.markdown("### 📊 전문가 팀 학습 가이드")
-                    st.markdown(f"""<div class="final-guidance">{result}</div>""", unsafe_allow_html=True)
-                    
-                    # 워크플로우 로그 (개발자 모드)
-                    with st.expander("🔍 워크플로우 로그 보기 (개발자 모드)"):
-                        st.json(education_team.workflow_logs[-1])
-                else:
-                    st.warning("현재 지식 수준과 학습 목표를 모두 입력해주세요.")
-    
-    elif service == "CS 학생 스펙 가이드":
-        st.subheader("CS 학생 스펙 가이드")
-        
-        # 예시 제공
-        with st.expander("예시 보기"):
-            st.markdown("""
-            **현재 상황 예시:**
-            - 2학년 CS 전공, Python 기초만 알고 있음
-            - 3학년 CS 전공, 웹 개발 경험 있음, 취업 준비 중
-            - 4학년 CS 전공, AI/ML 관심 있음, 대기업 목표
-            
-            **목표 예시:**
-            - 3학년까지 웹 개발 전문가가 되고 싶음
-            - 졸업 후 구글, 마이크로소프트 같은 빅테크 입사
-            - AI/ML 엔지니어로 취업하고 싶음
-            - 스타트업에서 풀스택 개발자로 일하고 싶음
-            """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            current_situation = st.text_area(
-                "현재 상황을 입력하세요", 
-                height=150,
-                placeholder="예: 2학년 CS 전공, Python 기초만 알고 있음",
-                help="현재 학년, 전공, 보유 기술, 경험 등을 구체적으로 입력해주세요"
-            )
-        with col2:
-            career_goals = st.text_area(
-                "목표를 입력하세요", 
-                height=150,
-                placeholder="예: 3학년까지 웹 개발 전문가가 되고 싶음",
-                help="구체적인 취업 목표나 기술 목표를 입력해주세요"
-            )
-        
-        # 분석 시작 버튼
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("스펙 가이드 생성", type="primary", use_container_width=True):
-                if current_situation.strip() and career_goals.strip():
-                    # 전문가 팀 사용
-                    education_team = st.session_state.current_team
-                    
-                    # 입력 데이터 구성
-                    input_data = {"current_situation": current_situation.strip(), "career_goals": career_goals.strip()}
-                    
-                    # 결과 처리
-                    result = education_team.get_ai_education("CS 학생 스펙 가이드", input_data)
-                    
-                    # 워크플로우 로그 저장
-                    st.session_state.workflow_logs.extend(education_team.workflow_logs)
-                    
-                    # 결과 표시
-                    st.markdown("### 전문가 팀 스펙 가이드")
-                    st.markdown(f"""<div class="final-guidance">{result}</div>""", unsafe_allow_html=True)
-                    
-                    # 워크플로우 로그 (개발자 모드)
-                    with st.expander("워크플로우 로그 보기 (개발자 모드)"):
-                        st.json(education_team.workflow_logs[-1])
-                else:
-                    st.warning("현재 상황과 목표를 모두 입력해주세요.")
-    
-    elif service == "AI 윤리 및 안전":
-        st.subheader("🛡️ AI 윤리 및 안전")
-        
-        # 예시 제공
-        with st.expander("💡 예시 보기"):
-            st.markdown("""
-            **추천 입력 예시:**
-            - AI 편향성과 공정성에 대해 알고 싶습니다.
-            - AI의 투명성과 설명 가능성에 관심이 있습니다.
-            - AI 개발 시 고려해야 할 윤리적 원칙들을 배우고 싶습니다.
-            - AI 안전성과 위험 관리에 대해 알고 싶습니다.
-            - AI 규제와 정책에 대해 학습하고 싶습니다.
-            """)
-        
-        area_of_interest = st.text_area(
-            "관심 있는 AI 윤리/안전 영역을 입력하세요", 
-            height=150,
-            placeholder="예: AI 편향성과 공정성에 대해 알고 싶습니다.",
-            help="구체적으로 관심 있는 AI 윤리나 안전 관련 주제를 입력해주세요"
-        )
-        
-        # 분석 시작 버튼
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🚀 학습 가이드 생성", type="primary", use_container_width=True):
-                if area_of_interest.strip():
-                    # 전문가 팀 사용
-                    education_team = st.session_state.current_team
-                    
-                    # 입력 데이터 구성
-                    input_data = {"area_of_interest": area_of_interest.strip()}
-                    
-                    # 결과 처리
-                    result = education_team.get_ai_education("AI 윤리 및 안전", input_data)
-                    
-                    # 워크플로우 로그 저장
-                    st.session_state.workflow_logs.extend(education_team.workflow_logs)
-                    
-                    # 결과 표시
-                    st.markdown("### 📊 전문가 팀 학습 가이드")
-                    st.markdown(f"""<div class="final-guidance">{result}</div>""", unsafe_allow_html=True)
-                    
-                    # 워크플로우 로그 (개발자 모드)
-                    with st.expander("🔍 워크플로우 로그 보기 (개발자 모드)"):
-                        st.json(education_team.workflow_logs[-1])
-                else:
-                    st.warning("관심 있는 AI 윤리/안전 영역을 입력해주세요.")
+    _render_service(service, batched_mode, parallel=not sequential_mode)
 
 # 스크립트가 직접 실행될 때만 main() 함수 실행
 if __name__ == "__main__":